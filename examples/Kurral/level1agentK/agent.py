@@ -8,6 +8,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.tools import Tool
@@ -20,8 +21,14 @@ from kurral.agent_decorator import trace_agent, trace_agent_invoke
 # Load environment variables
 load_dotenv()
 
+@lru_cache(maxsize=1)
 def get_llm():
-    """Initialize and return the appropriate LLM based on available API keys."""
+    """
+    Initialize and return the appropriate LLM based on available API keys.
+    
+    The client is built once per process; call get_llm.cache_clear() after
+    changing API keys to pick up a different provider.
+    """
     openai_key = os.getenv("OPENAI_API_KEY", "").strip()
     gemini_key = os.getenv("GEMINI_API_KEY", "").strip()
     groq_key = os.getenv("GROQ_API_KEY", "").strip()
@@ -44,43 +51,30 @@ def get_llm():
     else:
         raise ValueError("No API key provided. Please set OPENAI_API_KEY, GEMINI_API_KEY, or GROQ_API_KEY in .env file")
 
+_TOOLS = [
+    Tool(
+        name="get_full_form",
+        func=get_full_form,
+        description="Converts a short form abbreviation to its full form. Input should be a short form like 'AI', 'ML', 'API', etc."
+    ),
+    Tool(
+        name="multiply",
+        func=multiply,
+        description="Multiplies two numbers. Takes two numbers as input separated by comma, e.g., '5,3'"
+    ),
+    Tool(
+        name="add",
+        func=add,
+        description="Adds two numbers. Takes two numbers as input separated by comma, e.g., '5,3'"
+    ),
+]
+
 def create_tools():
     """Create tools for the agent."""
-    return [
-        Tool(
-            name="get_full_form",
-            func=get_full_form,
-            description="Converts a short form abbreviation to its full form. Input should be a short form like 'AI', 'ML', 'API', etc."
-        ),
-        Tool(
-            name="multiply",
-            func=multiply,
-            description="Multiplies two numbers. Takes two numbers as input separated by comma, e.g., '5,3'"
-        ),
-        Tool(
-            name="add",
-            func=add,
-            description="Adds two numbers. Takes two numbers as input separated by comma, e.g., '5,3'"
-        ),
-    ]
+    return list(_TOOLS)
 
-@trace_agent()
-def main():
-    """Main function to run the Level 1 agent."""
-    print("=" * 60)
-    print("Level 1 Agent - Short Form to Full Form Converter")
-    print("=" * 60)
-    print("\nThis agent converts short forms to full forms.")
-    print("Available short forms: AI, ML, API, HTTP, URL, CPU, GPU, RAM, SQL, JSON, XML, HTML, CSS, JS, PDF, CSV, REST, SOAP, IDE, OS")
-    print("\nYou can also ask for calculations (multiplication or addition).")
-    print("Type 'exit' to quit.\n")
-    
-    try:
-        llm = get_llm()
-        tools = create_tools()
-        
-        # Create ReAct prompt template
-        prompt = PromptTemplate.from_template("""
+# ReAct prompt template
+_REACT_PROMPT = PromptTemplate.from_template("""
 You are a helpful assistant that converts short forms to full forms and performs calculations.
 
 You have access to the following tools:
@@ -103,6 +97,24 @@ Begin!
 Question: {input}
 Thought: {agent_scratchpad}
 """)
+
+@trace_agent()
+def main():
+    """Main function to run the Level 1 agent."""
+    print("=" * 60)
+    print("Level 1 Agent - Short Form to Full Form Converter")
+    print("=" * 60)
+    print("\nThis agent converts short forms to full forms.")
+    print("Available short forms: AI, ML, API, HTTP, URL, CPU, GPU, RAM, SQL, JSON, XML, HTML, CSS, JS, PDF, CSV, REST, SOAP, IDE, OS")
+    print("\nYou can also ask for calculations (multiplication or addition).")
+    print("Type 'exit' to quit.\n")
+    
+    try:
+        llm = get_llm()
+        tools = create_tools()
+        
+        # Create ReAct prompt template
+        prompt = _REACT_PROMPT
         
         # Create ReAct agent
         agent = create_react_agent(llm, tools, prompt)
@@ -8,6 +8,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.tools import Tool
@@ -20,8 +21,14 @@ from kurral.agent_decorator import trace_agent, trace_agent_invoke
 # Load environment variables
 load_dotenv()
 
+@lru_cache(maxsize=1)
 def get_llm():
-    """Initialize and return the appropriate LLM based on available API keys."""
+    """
+    Initialize and return the appropriate LLM based on available API keys.
+    
+    The client is built once per process; call get_llm.cache_clear() after
+    changing API keys to pick up a different provider.
+    """
     openai_key = os.getenv("OPENAI_API_KEY", "").strip()
     gemini_key = os.getenv("GEMINI_API_KEY", "").strip()
     groq_key = os.getenv("GROQ_API_KEY", "").strip()
@@ -44,6 +51,11 @@ def get_llm():
     else:
         raise ValueError("No API key provided. Please set OPENAI_API_KEY, GEMINI_API_KEY, or GROQ_API_KEY in .env file")
 
+@lru_cache(maxsize=1)
+def _get_tavily(api_key: str) -> TavilyClient:
+    """Return a Tavily client for api_key, reused across searches to keep its connection alive."""
+    return TavilyClient(api_key=api_key)
+
 def tavily_search(query: str) -> str:
     """
     Performs an internet search using Tavily API.
@@ -62,7 +74,7 @@ def tavily_search(query: str) -> str:
         return "Error: TAVILY_API_KEY not set in environment variables"
     
     try:
-        client = TavilyClient(api_key=tavily_key)
+        client = _get_tavily(tavily_key)
         response = client.search(query=query, max_results=5)
         
         results = []
@@ -81,37 +93,20 @@ def tavily_search(query: str) -> str:
         print(f"   {error_msg}")
         return error_msg
 
+_TOOLS = [
+    Tool(
+        name="tavily_search",
+        func=tavily_search,
+        description="Performs an internet search using Tavily API. Use this tool to search for current information, news, facts, or any topic. Input should be a search query string."
+    ),
+]
+
 def create_tools():
     """Create tools for the agent."""
-    return [
-        Tool(
-            name="tavily_search",
-            func=tavily_search,
-            description="Performs an internet search using Tavily API. Use this tool to search for current information, news, facts, or any topic. Input should be a search query string."
-        ),
-    ]
+    return list(_TOOLS)
 
-@trace_agent()
-def main():
-    """Main function to run the Level 2 agent."""
-    print("=" * 60)
-    print("Level 2 Agent - Internet Search Agent")
-    print("=" * 60)
-    print("\nThis agent performs internet searches to answer your questions.")
-    print("Type 'exit' to quit.\n")
-    
-    # Check for Tavily API key
-    tavily_key = os.getenv("TAVILY_API_KEY", "").strip()
-    if not tavily_key:
-        print("Warning: TAVILY_API_KEY not set. Internet search will not work.")
-        print("Please set TAVILY_API_KEY in your .env file.\n")
-    
-    try:
-        llm = get_llm()
-        tools = create_tools()
-        
-        # Create ReAct prompt template
-        prompt = PromptTemplate.from_template("""
+# ReAct prompt template
+_REACT_PROMPT = PromptTemplate.from_template("""
 You are a helpful assistant that answers questions by searching the internet.
 
 You have access to the following tools:
@@ -133,6 +128,28 @@ Begin!
 Question: {input}
 Thought: {agent_scratchpad}
 """)
+
+@trace_agent()
+def main():
+    """Main function to run the Level 2 agent."""
+    print("=" * 60)
+    print("Level 2 Agent - Internet Search Agent")
+    print("=" * 60)
+    print("\nThis agent performs internet searches to answer your questions.")
+    print("Type 'exit' to quit.\n")
+    
+    # Check for Tavily API key
+    tavily_key = os.getenv("TAVILY_API_KEY", "").strip()
+    if not tavily_key:
+        print("Warning: TAVILY_API_KEY not set. Internet search will not work.")
+        print("Please set TAVILY_API_KEY in your .env file.\n")
+    
+    try:
+        llm = get_llm()
+        tools = create_tools()
+        
+        # Create ReAct prompt template
+        prompt = _REACT_PROMPT
         
         # Create ReAct agent
         agent = create_react_agent(llm, tools, prompt)
@@ -8,6 +8,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 import os
+import logging
+from functools import lru_cache
 from dotenv import load_dotenv
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.tools import Tool
@@ -15,14 +17,20 @@ from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from tavily import TavilyClient
-from send_email import send_email
+from send_email import send_email, send_email_in_background
 from kurral.agent_decorator import trace_agent, trace_agent_invoke
 
 # Load environment variables
 load_dotenv()
 
+@lru_cache(maxsize=1)
 def get_llm():
-    """Initialize and return the appropriate LLM based on available API keys."""
+    """
+    Initialize and return the appropriate LLM based on available API keys.
+    
+    The client is built once per process; call get_llm.cache_clear() after
+    changing API keys to pick up a different provider.
+    """
     openai_key = os.getenv("OPENAI_API_KEY", "").strip()
     gemini_key = os.getenv("GEMINI_API_KEY", "").strip()
     groq_key = os.getenv("GROQ_API_KEY", "").strip()
@@ -45,6 +53,11 @@ def get_llm():
     else:
         raise ValueError("No API key provided. Please set OPENAI_API_KEY, GEMINI_API_KEY, or GROQ_API_KEY in .env file")
 
+@lru_cache(maxsize=1)
+def _get_tavily(api_key: str) -> TavilyClient:
+    """Return a Tavily client for api_key, reused across searches to keep its connection alive."""
+    return TavilyClient(api_key=api_key)
+
 def tavily_search(query: str) -> str:
     """
     Performs an internet search using Tavily API.
@@ -63,7 +76,7 @@ def tavily_search(query: str) -> str:
         return "Error: TAVILY_API_KEY not set in environment variables"
     
     try:
-        client = TavilyClient(api_key=tavily_key)
+        client = _get_tavily(tavily_key)
         response = client.search(query=query, max_results=5)
         
         results = []
@@ -82,6 +95,12 @@ def tavily_search(query: str) -> str:
         print(f"   {error_msg}")
         return error_msg
 
+def _log_failed_background_send(future) -> None:
+    """Report a background send that raised or returned False"""
+    error = future.exception()
+    if error is not None or not future.result():
+        logging.getLogger(__name__).error("Background email to arvind@tailorflow.ai failed: %s", error or "SMTP error")
+
 def send_email_tool(input_str: str) -> str:
     """
     Sends an email to jayjani482001@gmail.com.
@@ -112,49 +131,41 @@ def send_email_tool(input_str: str) -> str:
         
         print(f"   Subject: {subject}")
         
-        send_email("arvind@tailorflow.ai", subject, body)
+        # With credentials configured the email goes out in the background,
+        # so the agent's answer isn't held up by the SMTP round-trip;
+        # otherwise send now so send_email can prompt for them. The reply is
+        # the same either way, so recorded artifacts don't depend on the setup
+        if os.getenv("EMAIL_SENDER") is not None and os.getenv("EMAIL_PASSWORD") is not None:
+            # Quiet, so the sender thread doesn't print over the next prompt
+            future = send_email_in_background("arvind@tailorflow.ai", subject, body, verbosity=False)
+            future.add_done_callback(_log_failed_background_send)
+        else:
+            send_email("arvind@tailorflow.ai", subject, body)
         return "Email sent successfully to arvind@tailorflow.ai"
     except Exception as e:
         error_msg = f"Error sending email: {str(e)}"
         print(f"   {error_msg}")
         return error_msg
 
+_TOOLS = [
+    Tool(
+        name="tavily_search",
+        func=tavily_search,
+        description="Performs an internet search using Tavily API. Use this tool to search for current information, news, facts, or any topic. Input should be a search query string."
+    ),
+    Tool(
+        name="send_email",
+        func=send_email_tool,
+        description="Sends an email to jayjani482001@gmail.com. Use this tool when you need to send an email. Input should be a string with subject and body separated by a newline or pipe (|) character. Format: 'Subject: <subject>\\nBody: <body>' or '<subject>|<body>'."
+    ),
+]
+
 def create_tools():
     """Create tools for the agent."""
-    return [
-        Tool(
-            name="tavily_search",
-            func=tavily_search,
-            description="Performs an internet search using Tavily API. Use this tool to search for current information, news, facts, or any topic. Input should be a search query string."
-        ),
-        Tool(
-            name="send_email",
-            func=send_email_tool,
-            description="Sends an email to jayjani482001@gmail.com. Use this tool when you need to send an email. Input should be a string with subject and body separated by a newline or pipe (|) character. Format: 'Subject: <subject>\\nBody: <body>' or '<subject>|<body>'."
-        ),
-    ]
+    return list(_TOOLS)
 
-@trace_agent()
-def main():
-    """Main function to run the Level 3 agent."""
-    print("=" * 60)
-    print("Level 3 Agent - Internet Search Agent with Email")
-    print("=" * 60)
-    print("\nThis agent performs internet searches to answer your questions and can send emails.")
-    print("Type 'exit' to quit.\n")
-    
-    # Check for Tavily API key
-    tavily_key = os.getenv("TAVILY_API_KEY", "").strip()
-    if not tavily_key:
-        print("Warning: TAVILY_API_KEY not set. Internet search will not work.")
-        print("Please set TAVILY_API_KEY in your .env file.\n")
-    
-    try:
-        llm = get_llm()
-        tools = create_tools()
-        
-        # Create ReAct prompt template
-        prompt = PromptTemplate.from_template("""
+# ReAct prompt template
+_REACT_PROMPT = PromptTemplate.from_template("""
 You are a helpful assistant that answers questions by searching the internet.
 
 You have access to the following tools:
@@ -176,6 +187,28 @@ Begin!
 Question: {input}
 Thought: {agent_scratchpad}
 """)
+
+@trace_agent()
+def main():
+    """Main function to run the Level 3 agent."""
+    print("=" * 60)
+    print("Level 3 Agent - Internet Search Agent with Email")
+    print("=" * 60)
+    print("\nThis agent performs internet searches to answer your questions and can send emails.")
+    print("Type 'exit' to quit.\n")
+    
+    # Check for Tavily API key
+    tavily_key = os.getenv("TAVILY_API_KEY", "").strip()
+    if not tavily_key:
+        print("Warning: TAVILY_API_KEY not set. Internet search will not work.")
+        print("Please set TAVILY_API_KEY in your .env file.\n")
+    
+    try:
+        llm = get_llm()
+        tools = create_tools()
+        
+        # Create ReAct prompt template
+        prompt = _REACT_PROMPT
         
         # Create ReAct agent
         agent = create_react_agent(llm, tools, prompt)
@@ -1,13 +1,139 @@
 ## invoke the email api
 ## (Message, email) --> email sent confirmation
+import atexit
 import smtplib
 import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+SMTP_SERVER = "smtp.gmail.com"
+SMTP_PORT = 465
+## Set USE_STARTTLS to connect in plain text on 587 and upgrade with
+## STARTTLS, so a server can reject the client before the TLS handshake
+USE_STARTTLS = False
+STARTTLS_PORT = 587
+## Seconds before a connect, handshake or command gives up, so a stalled
+## server can't hang the agent
+SMTP_TIMEOUT = 15
+
+## Built once: creating a context loads and parses the system CA bundle,
+## and the same context serves every (re)connect
+_SSL_CONTEXT = ssl.create_default_context()
+
+## One logged-in SMTP connection is kept for the whole process, so only the
+## first email pays for the TLS handshake and login. It is replaced after
+## MAX_MSGS_PER_CONN messages to stay under provider per-connection limits.
+MAX_MSGS_PER_CONN = 100
+_smtp = None
+_smtp_sent = 0
+_smtp_lock = threading.Lock()
+
+## Background sender for send_email_in_background; a single worker keeps
+## emails in order on the shared connection. Pending sends finish before
+## the interpreter exits.
+_email_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="send-email")
+
+
+def _get_smtp(sender_email, sender_password):
+    """
+    Return the cached SMTP connection, reconnecting if it has gone stale
+    or has reached MAX_MSGS_PER_CONN. Callers hold _smtp_lock.
+    """
+    global _smtp, _smtp_sent
+    if _smtp is not None and _smtp_sent < MAX_MSGS_PER_CONN:
+        try:
+            if _smtp.noop()[0] == 250:
+                return _smtp
+        except (smtplib.SMTPException, OSError):
+            pass
+    _close_smtp()
+    if USE_STARTTLS:
+        server = smtplib.SMTP(SMTP_SERVER, STARTTLS_PORT, timeout=SMTP_TIMEOUT)
+    else:
+        server = smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=_SSL_CONTEXT, timeout=SMTP_TIMEOUT)
+    try:
+        if USE_STARTTLS:
+            server.starttls(context=_SSL_CONTEXT)
+        server.login(sender_email, sender_password)
+    except Exception:
+        server.close()
+        raise
+    _smtp = server
+    _smtp_sent = 0
+    return _smtp
+
+
+def _send_message(msg, sender_email, sender_password):
+    """
+    Send msg on the cached connection. If the server dropped it between
+    the liveness check and the send, reconnect and retry once.
+    Callers hold _smtp_lock.
+    """
+    global _smtp_sent
+    server = _get_smtp(sender_email, sender_password)
+    try:
+        server.send_message(msg)
+    except smtplib.SMTPServerDisconnected:
+        _close_smtp()
+        server = _get_smtp(sender_email, sender_password)
+        server.send_message(msg)
+    _smtp_sent += 1
+
+
+def _close_smtp():
+    """Drop the cached SMTP connection"""
+    global _smtp
+    if _smtp is not None:
+        try:
+            _smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            _smtp.close()
+        _smtp = None
+
+
+def _quit_smtp_at_exit():
+    with _smtp_lock:
+        _close_smtp()
+
+
+## The background sender's pending sends are joined at threading shutdown,
+## before atexit handlers run, so the connection is closed after them
+atexit.register(_quit_smtp_at_exit)
+
+
+## Sender credentials, resolved on the first send (not at import, so
+## importing this module never prompts) and reused afterwards
+_credentials = None
+
+
+def _sender_credentials():
+    """Sender email and password from the environment, prompting if unset"""
+    global _credentials
+    if _credentials is None:
+        if os.environ.get("EMAIL_SENDER") is None:
+            value = input("Enter the sender's email ").strip()
+            os.environ["EMAIL_SENDER"] = value
+        if os.environ.get("EMAIL_PASSWORD") is None:
+            value = input("Input the password for your email ").strip()
+            os.environ["EMAIL_PASSWORD"] = value
+        _credentials = (os.environ["EMAIL_SENDER"], os.environ["EMAIL_PASSWORD"])
+    return _credentials
+
+
+def _build_message(sender_email, receiver_email, subject, body):
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = sender_email
+    msg["To"] = receiver_email
+    msg.set_content(body)
+    return msg
+
+
 def send_email(receiver_email, subject, body, verbosity = True):
     """
     Sends an email using Gmail SMTP server.
@@ -20,41 +146,38 @@ def send_email(receiver_email, subject, body, verbosity = True):
     """
     # print("-----------------Hit the email --------------------")
     # return
-    if os.environ.get("EMAIL_SENDER") is None:
-        value = input("Enter the sender's email ").strip()
-        os.environ["EMAIL_SENDER"] = value
-    if os.environ.get("EMAIL_PASSWORD") is None:
-        value = input("Input the password for your email ").strip()
-        os.environ["EMAIL_PASSWORD"] = value
-    sender_email = os.environ["EMAIL_SENDER"]
-    sender_password = os.environ["EMAIL_PASSWORD"]
-    smtp_server = "smtp.gmail.com"
-    port = 465
-
-    context = ssl.create_default_context()
+    sender_email, sender_password = _sender_credentials()
 
-    msg = EmailMessage()
-    msg["Subject"] = subject
-    msg["From"] = sender_email
-    msg["To"] = receiver_email
-    msg.set_content(body)
+    msg = _build_message(sender_email, receiver_email, subject, body)
     if verbosity:
         print("The email has been generated, yet to send")
 
     try:
-        ## Making connection to smtp server
-        with smtplib.SMTP_SSL(smtp_server, port, context=context) as server:
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
-            if verbosity:
-                print("Email sent to {0}".format(receiver_email))
-            return True
+        ## Reusing the connection to smtp server
+        with _smtp_lock:
+            _send_message(msg, sender_email, sender_password)
+        if verbosity:
+            print("Email sent to {0}".format(receiver_email))
+        return True
     except Exception as e:
         print("Email API failed")
         if verbosity:
             print("Error: Unable to send email. {0}".format(e))
         return False
 
+
+def send_email_in_background(receiver_email, subject, body, verbosity = True):
+    """
+    Queues send_email on a background thread and returns right away.
+
+    Sender credentials must already be set (EMAIL_SENDER and EMAIL_PASSWORD),
+    since the background thread can't prompt for them.
+
+    Returns:
+        A Future that resolves to send_email's True/False result
+    """
+    return _email_pool.submit(send_email, receiver_email, subject, body, verbosity)
+
 # def main():
 #     ## This main function is just for testing this, no need to import this in the app.py
 #     receiver_email = "jayjani482001@gmail.com"
@@ -2,31 +2,37 @@
 Kurral - Deterministic Testing and Replay for AI Agents
 """
 
+import importlib
+
 __version__ = "0.2.2"
 __author__ = "Kurral Team"
 __email__ = "team@kurral.com"
 
-# Core decorators and functions
-from kurral.agent_decorator import trace_agent, trace_agent_invoke
+# Public names are imported on first access: the decorators pull in LangChain,
+# which would otherwise slow every `kurral` CLI invocation (even --help)
+_LAZY_EXPORTS = {
+    # Core decorators and functions
+    "trace_agent": ("kurral.agent_decorator", "trace_agent"),
+    "trace_agent_invoke": ("kurral.agent_decorator", "trace_agent_invoke"),
+    # Replay functionality
+    "replay_artifact": ("kurral.agent_replay", "replay_agent_artifact"),
+    # ARS Scoring
+    "calculate_ars": ("kurral.ars_scorer", "calculate_ars"),
+    # MCP Proxy (optional - only usable if dependencies installed)
+    "KurralMCPProxy": ("kurral.mcp.proxy", "KurralMCPProxy"),
+    "create_proxy": ("kurral.mcp.proxy", "create_proxy"),
+    "MCPConfig": ("kurral.mcp.config", "MCPConfig"),
+}
 
-# Replay functionality
-from kurral.agent_replay import replay_agent_artifact as replay_artifact
 
-# ARS Scoring
-from kurral.ars_scorer import calculate_ars
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module 'kurral' has no attribute '{name}'") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
 
-# MCP Proxy (optional - only if dependencies installed)
-try:
-    from kurral.mcp.proxy import KurralMCPProxy, create_proxy
-    from kurral.mcp.config import MCPConfig
-    _mcp_exports = ["KurralMCPProxy", "create_proxy", "MCPConfig"]
-except ImportError:
-    _mcp_exports = []
 
-__all__ = [
-    "__version__",
-    "trace_agent",
-    "trace_agent_invoke",
-    "replay_artifact",
-    "calculate_ars",
-] + _mcp_exports
\ No newline at end of file
+__all__ = ["__version__"] + list(_LAZY_EXPORTS)
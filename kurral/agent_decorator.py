@@ -4,7 +4,9 @@ Minimal code changes - just add @trace_agent() decorator to your main function
 """
 
 import functools
+import hashlib
 import inspect
+import json
 import time
 from datetime import datetime
 from pathlib import Path
@@ -20,6 +22,7 @@ from kurral.langchain_integration import (
     extract_llm_config_from_langchain,
     extract_resolved_prompt,
     compute_graph_version,
+    compute_tool_schemas_hash,
 )
 from kurral.models.kurral import (
     ModelConfig,
@@ -32,6 +35,7 @@ from kurral.models.kurral import (
 )
 from kurral.artifact_manager import ArtifactManager
 from kurral.artifact_generator import ArtifactGenerator
+from kurral.cache import MemoryCache
 
 T = TypeVar("T")
 
@@ -40,9 +44,15 @@ _current_context: Optional[Dict[str, Any]] = None
 
 # Session artifact context - accumulates all interactions in one artifact
 _session_artifact: Optional[Any] = None  # Will hold KurralArtifact
-_session_interactions: list[Dict[str, Any]] = []  # List of all interactions
+_session_interaction_count = 0  # Interactions folded into _session_artifact
 _session_start_time: Optional[datetime] = None
 
+# Artifact directories already created in this process
+_created_artifact_dirs: set[Path] = set()
+
+# ArtifactGenerator is stateless, so every invoke shares one
+_artifact_generator = ArtifactGenerator()
+
 
 def _sanitize_for_serialization(obj: Any, max_depth: int = 5, current_depth: int = 0) -> Any:
     """Sanitize object for JSON serialization"""
@@ -63,6 +73,62 @@ def _sanitize_for_serialization(obj: Any, max_depth: int = 5, current_depth: int
         return str(obj)
 
 
+def _record_session_interaction(interaction: Dict[str, Any]) -> None:
+    """
+    Append one interaction to the session and its accumulated artifact
+    
+    Updates are incremental so each invoke costs O(1) instead of rebuilding
+    inputs, outputs and tool_calls from every interaction so far. The
+    interaction dict itself isn't retained; the artifact holds its data.
+    """
+    global _session_interaction_count
+    _session_interaction_count += 1
+    _session_artifact.inputs.setdefault("interactions", []).append(interaction["input"])
+    _session_artifact.outputs.setdefault("interactions", []).append(interaction["output"])
+    _session_artifact.tool_calls.extend(interaction["tool_calls"])
+    _session_artifact.duration_ms += interaction["duration_ms"]
+
+
+def _result_cache_key(tools: list, llm: Any, input_data: Dict[str, Any]) -> str:
+    """Fingerprint an invoke by tool schemas, model name and canonical input"""
+    payload = json.dumps(
+        {
+            "tools": compute_tool_schemas_hash(tools),
+            "model": getattr(llm, "model_name", None) or getattr(llm, "model", None),
+            "input": _sanitize_for_serialization(input_data),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _invoke_with_result_cache(
+    agent_executor: AgentExecutor,
+    input_data: Dict[str, Any],
+    tool_handler: ToolCallCaptureHandler,
+    result_cache: Optional[MemoryCache],
+    cache_key: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Invoke the agent, or return the result of an identical earlier invoke
+    
+    On a hit, the cached tool calls are replayed into tool_handler so the
+    recorded interaction matches the original one.
+    """
+    if result_cache is not None:
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            tool_handler.tool_calls.extend(cached["tool_calls"])
+            return dict(cached["result"])
+    
+    result = agent_executor.invoke(input_data, config={"callbacks": [tool_handler]})
+    
+    if result_cache is not None:
+        result_cache.prime(cache_key, {"result": dict(result), "tool_calls": list(tool_handler.tool_calls)})
+    return result
+
+
 def _get_agent_folder_path(func: Callable) -> Path:
     """Determine the agent folder path from the calling function's file location"""
     try:
@@ -83,7 +149,7 @@ def _get_agent_folder_path(func: Callable) -> Path:
         
         # Default: use directory containing the file
         return func_path.parent
-    except:
+    except Exception:
         # Fallback: current directory
         return Path.cwd()
 
@@ -127,19 +193,18 @@ def trace_agent_invoke(
             # Default to ./artifacts in current directory
             artifacts_dir = Path.cwd() / "artifacts"
     
+    # Create each directory once per process rather than on every invoke; the
+    # session artifact itself is saved by trace_agent's ArtifactManager
     artifacts_dir = Path(artifacts_dir)
-    artifacts_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Determine agent directory for config loading (parent of artifacts_dir)
-    agent_dir = artifacts_dir.parent if artifacts_dir.name == "artifacts" else None
+    if artifacts_dir not in _created_artifact_dirs:
+        artifacts_dir.mkdir(parents=True, exist_ok=True)
+        _created_artifact_dirs.add(artifacts_dir)
     
-    # Create managers
-    artifact_manager = ArtifactManager(storage_path=artifacts_dir, agent_dir=agent_dir)
-    artifact_generator = ArtifactGenerator()
+    artifact_generator = _artifact_generator
     
     # Start timing
     start_time = datetime.utcnow()
-    start_ms = time.time() * 1000
+    start_ns = time.perf_counter_ns()
     
     # Initialize capture handler
     tool_handler = ToolCallCaptureHandler()
@@ -185,7 +250,7 @@ def trace_agent_invoke(
                             elif hasattr(step, 'bound') and hasattr(step.bound, 'llm'):
                                 extracted_llm = step.bound.llm
                                 break
-                    except:
+                    except Exception:
                         pass
             
             # Method 4: Try to get from the prompt chain if available
@@ -205,7 +270,7 @@ def trace_agent_invoke(
                     if extracted_llm is None and hasattr(runnable, 'last'):
                         if hasattr(runnable.last, 'llm'):
                             extracted_llm = runnable.last.llm
-                except:
+                except Exception:
                     pass
         
         # Method 5: Try to extract from the agent's internal structure recursively
@@ -236,12 +301,12 @@ def trace_agent_invoke(
                                 result = find_llm_in_obj(item, depth+1, max_depth)
                                 if result:
                                     return result
-                        except:
+                        except Exception:
                             pass
                     return None
                 
                 extracted_llm = find_llm_in_obj(agent)
-            except:
+            except Exception:
                 pass
     
     tools = getattr(agent_executor, 'tools', [])
@@ -250,29 +315,33 @@ def trace_agent_invoke(
     user_input = str(input_data.get('input', ''))
     
     # Declare globals at the start
-    global _session_artifact, _session_interactions
+    global _session_artifact
+    
+    # Identical invokes within a trace_agent(cache=True) session reuse the first result
+    result_cache = _current_context.get("result_cache") if _current_context else None
+    cache_key = _result_cache_key(tools, extracted_llm, input_data) if result_cache is not None else None
     
     # Execute with callbacks
     try:
-        result = agent_executor.invoke(input_data, config={"callbacks": [tool_handler]})
+        result = _invoke_with_result_cache(agent_executor, input_data, tool_handler, result_cache, cache_key)
     except Exception as e:
         error_msg = str(e)
-        duration_ms = int(time.time() * 1000 - start_ms)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         # Append error interaction to session artifact
         if auto_export:
-            # Extract LLM config and prompt for error case
-            llm_config = extract_llm_config_from_langchain(extracted_llm) if extracted_llm else ModelConfig(
-                model_name="unknown",
-                provider="unknown",
-                parameters=LLMParameters(temperature=0.0),
-            )
-            
-            prompt = extract_resolved_prompt(agent_executor, user_input)
-            graph_version = compute_graph_version(tools, prompt) if tools else None
-            
             # Initialize session artifact if needed
             if _session_artifact is None:
+                # Extract LLM config and prompt for error case
+                llm_config = extract_llm_config_from_langchain(extracted_llm) if extracted_llm else ModelConfig(
+                    model_name="unknown",
+                    provider="unknown",
+                    parameters=LLMParameters(temperature=0.0),
+                )
+                
+                prompt = extract_resolved_prompt(agent_executor, user_input)
+                graph_version = compute_graph_version(tools, prompt) if tools else None
+                
                 run_id = f"local_agent_{int(start_time.timestamp())}"
                 _session_artifact = artifact_generator.generate(
                     run_id=run_id,
@@ -298,38 +367,15 @@ def trace_agent_invoke(
                 "timestamp": start_time.isoformat(),
                 "error": error_msg,
             }
-            _session_interactions.append(interaction)
-            
-            # Update artifact
-            _session_artifact.inputs = {"interactions": [i["input"] for i in _session_interactions]}
-            _session_artifact.outputs = {"interactions": [i["output"] for i in _session_interactions]}
+            _record_session_interaction(interaction)
             
-            all_tool_calls = []
-            for interaction in _session_interactions:
-                all_tool_calls.extend(interaction["tool_calls"])
-            _session_artifact.tool_calls = all_tool_calls
-            
-            # Set error if any interaction had an error
-            if any(i.get("error") for i in _session_interactions):
-                _session_artifact.error = "One or more interactions failed"
+            # Mark the session as failed since this interaction had an error
+            _session_artifact.error = "One or more interactions failed"
         
         raise
     
     # Stop timing
-    duration_ms = int(time.time() * 1000 - start_ms)
-    
-    # Extract LLM config
-    llm_config = extract_llm_config_from_langchain(extracted_llm) if extracted_llm else ModelConfig(
-        model_name="unknown",
-        provider="unknown",
-        parameters=LLMParameters(temperature=0.0),
-    )
-    
-    # Extract prompt
-    prompt = extract_resolved_prompt(agent_executor, user_input)
-    
-    # Compute graph version
-    graph_version = compute_graph_version(tools, prompt) if tools else None
+    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
     
     # Prepare outputs
     outputs = _sanitize_for_serialization(result)
@@ -338,7 +384,23 @@ def trace_agent_invoke(
     if auto_export:
         # Check if we have a session artifact (created by decorator)
         if _session_artifact is None:
-            # First interaction - create the artifact
+            # First interaction - create the artifact. The LLM config, prompt
+            # and graph version are only recorded once per session, so later
+            # interactions skip extracting and hashing them
+            
+            # Extract LLM config
+            llm_config = extract_llm_config_from_langchain(extracted_llm) if extracted_llm else ModelConfig(
+                model_name="unknown",
+                provider="unknown",
+                parameters=LLMParameters(temperature=0.0),
+            )
+            
+            # Extract prompt
+            prompt = extract_resolved_prompt(agent_executor, user_input)
+            
+            # Compute graph version
+            graph_version = compute_graph_version(tools, prompt) if tools else None
+            
             run_id = f"local_agent_{int(start_time.timestamp())}"
             _session_artifact = artifact_generator.generate(
                 run_id=run_id,
@@ -363,21 +425,7 @@ def trace_agent_invoke(
             "duration_ms": duration_ms,
             "timestamp": start_time.isoformat(),
         }
-        _session_interactions.append(interaction)
-        
-        # Update artifact with accumulated data
-        _session_artifact.inputs = {"interactions": [i["input"] for i in _session_interactions]}
-        _session_artifact.outputs = {"interactions": [i["output"] for i in _session_interactions]}
-        
-        # Accumulate all tool calls
-        all_tool_calls = []
-        for interaction in _session_interactions:
-            all_tool_calls.extend(interaction["tool_calls"])
-        _session_artifact.tool_calls = all_tool_calls
-        
-        # Update total duration
-        total_duration = sum(i["duration_ms"] for i in _session_interactions)
-        _session_artifact.duration_ms = total_duration
+        _record_session_interaction(interaction)
     
     return result
 
@@ -386,6 +434,8 @@ def trace_agent(
     tenant_id: str = "default",
     environment: str = "production",
     auto_export: bool = True,
+    cache: bool = False,
+    cache_max_entries: int = 256,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator for tracing LangChain agent execution and generating artifacts
@@ -407,11 +457,15 @@ def trace_agent(
         tenant_id: Tenant identifier
         environment: Environment name (production, staging, etc.)
         auto_export: Whether to automatically save artifacts
+        cache: Return the earlier result (and recorded tool calls) when
+            trace_agent_invoke() sees the same input, tools and model again
+            during this call, instead of re-running the agent
+        cache_max_entries: Maximum number of results kept when cache is enabled
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            global _current_context, _session_artifact, _session_interactions, _session_start_time
+            global _current_context, _session_artifact, _session_interaction_count, _session_start_time
             
             # Determine artifacts directory from function location
             agent_folder = _get_agent_folder_path(func)
@@ -421,13 +475,14 @@ def trace_agent(
             # Initialize session
             _session_start_time = datetime.utcnow()
             _session_artifact = None
-            _session_interactions = []
+            _session_interaction_count = 0
             
             # Set current context
             _current_context = {
                 "artifacts_dir": artifacts_dir,
                 "tenant_id": tenant_id,
                 "environment": environment,
+                "result_cache": MemoryCache(max_entries=cache_max_entries) if cache else None,
             }
             
             # Pass agent folder for config loading
@@ -439,7 +494,7 @@ def trace_agent(
                 return result
             finally:
                 # Save the accumulated artifact if we have interactions
-                if auto_export and _session_artifact is not None and len(_session_interactions) > 0:
+                if auto_export and _session_artifact is not None and _session_interaction_count > 0:
                     try:
                         # Update final duration
                         if _session_start_time:
@@ -457,7 +512,7 @@ def trace_agent(
                         print(f"\n[Kurral] Session artifact saved: {artifact_path}")
                         print(f"[Kurral] Run ID: {_session_artifact.run_id}")
                         print(f"[Kurral] Kurral ID: {_session_artifact.kurral_id}")
-                        print(f"[Kurral] Total interactions: {len(_session_interactions)}")
+                        print(f"[Kurral] Total interactions: {_session_interaction_count}")
                     except Exception as e:
                         import traceback
                         error_details = traceback.format_exc()
@@ -471,13 +526,13 @@ def trace_agent(
                                 f.write(f"Failed to save artifact: {e}\n")
                                 f.write(f"{error_details}\n")
                             print(f"[Kurral] Error details saved to: {error_log_path}")
-                        except:
+                        except Exception:
                             pass
                 
                 # Clear context
                 _current_context = None
                 _session_artifact = None
-                _session_interactions = []
+                _session_interaction_count = 0
                 _session_start_time = None
         
         return wrapper
@@ -6,6 +6,7 @@ Usage: from kurral.agent_replay import replay_agent_artifact
 
 import asyncio
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -592,10 +593,10 @@ def replay_agent_artifact(
                     print(f"\nYou: {user_input}")
                     
                     # Execute agent with this input
-                    start_time = datetime.utcnow()
+                    start_ns = time.perf_counter_ns()
                     try:
                         result = agent_executor.invoke({"input": user_input})
-                        duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                         total_duration_ms += duration_ms
                         
                         output = result.get("output", "")
@@ -606,7 +607,7 @@ def replay_agent_artifact(
                             "output": output
                         })
                     except Exception as e:
-                        duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                         total_duration_ms += duration_ms
                         error_msg = str(e)
                         print(f"Error: {error_msg}")
@@ -618,14 +619,7 @@ def replay_agent_artifact(
                     print()
                 
                 # Collect all tool calls (cached + new)
-                # Get cached tool calls that were used
-                used_cached_tool_calls = []
-                for cache_key in stubber.used_keys:
-                    if cache_key in stubber.cache:
-                        tc = stubber.cache[cache_key]
-                        # Mark as stubbed
-                        tc.stubbed_in_replay = True
-                        used_cached_tool_calls.append(tc)
+                used_cached_tool_calls = stubber.get_used_tool_calls()
                 
                 # Combine cached (used) and new tool calls
                 all_tool_calls = used_cached_tool_calls + stubber.new_tool_calls
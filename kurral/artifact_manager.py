@@ -3,17 +3,21 @@ Artifact manager for storing and retrieving kurral artifacts
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Optional, List, Tuple
 from uuid import UUID
 
 from kurral.models.kurral import KurralArtifact
-from kurral.storage import StorageBackend, create_storage_backend
+from kurral.storage import StorageBackend, StorageResult, create_storage_backend
 from kurral.storage.local_storage import LocalStorage
 from kurral.config import StorageConfig, get_storage_config
 from kurral.database.metadata_service import MetadataService
 
+# Concurrent uploads when migrating local artifacts to R2
+MIGRATION_WORKERS = 8
+
 
 class ArtifactManager:
     """
@@ -92,25 +96,7 @@ class ArtifactManager:
         Returns:
             Path (for backward compatibility - may be None for R2-only)
         """
-        # Auto-migrate on first save if using R2
-        if self.using_r2 and not self._migration_checked:
-            self._migration_checked = True
-            try:
-                # Migrate existing artifacts
-                artifacts_stats = self.migrate_local_to_r2()
-                
-                # Migrate existing replay artifacts
-                if self.agent_dir:
-                    replay_runs_dir = self.agent_dir / "replay_runs"
-                    if replay_runs_dir.exists():
-                        replay_stats = self.migrate_replay_artifacts_to_r2(replay_runs_dir)
-                        total_migrated = artifacts_stats["migrated"] + replay_stats["migrated"]
-                        if total_migrated > 0:
-                            print(f"[Kurral] Migrated {total_migrated} artifacts to R2")
-            except Exception as e:
-                # Don't fail save if migration fails
-                import warnings
-                warnings.warn(f"Migration warning: {e}")
+        self._migrate_on_first_save()
         
         # Save to configured backend
         result = self.backend.save(artifact)
@@ -132,13 +118,79 @@ class ArtifactManager:
                 self.metadata_service.save_metadata(
                     artifact=artifact,
                     storage_uri=storage_uri,
-                    storage_backend=storage_backend
+                    storage_backend=storage_backend,
+                    artifact_size=result.size_bytes,
                 )
             except Exception as e:
                 # Don't fail artifact save if metadata save fails
                 import warnings
                 warnings.warn(f"Failed to save artifact metadata to database: {e}")
         
+        return self._result_path(artifact, result)
+    
+    def save_many(self, artifacts: list[KurralArtifact]) -> list[Optional[Path]]:
+        """
+        Save a batch of artifacts
+        
+        The backend saves the batch together (local storage rewrites its
+        index once) and metadata goes to PostgreSQL in one upsert.
+        
+        Args:
+            artifacts: KurralArtifacts to save
+            
+        Returns:
+            Path per artifact (as save() returns), or None where saving failed
+        """
+        self._migrate_on_first_save()
+        
+        results = self.backend.save_many(artifacts)
+        
+        saved = []
+        paths: list[Optional[Path]] = []
+        for artifact, result in zip(artifacts, results):
+            if not result.success:
+                import warnings
+                warnings.warn(f"Failed to save artifact: {result.error}")
+                paths.append(None)
+                continue
+            if result.storage_uri:
+                artifact.object_storage_uri = result.storage_uri
+            saved.append((artifact, result))
+            paths.append(self._result_path(artifact, result))
+        
+        # Save metadata to PostgreSQL if configured
+        if saved and self.metadata_service and self.metadata_service.is_available():
+            self.metadata_service.save_metadata_many(
+                [artifact for artifact, _ in saved],
+                storage_backend="r2" if self.using_r2 else "local",
+                artifact_sizes=[result.size_bytes for _, result in saved],
+            )
+        
+        return paths
+    
+    def _migrate_on_first_save(self) -> None:
+        """Migrate existing local artifacts to R2 the first time anything is saved"""
+        if self.using_r2 and not self._migration_checked:
+            self._migration_checked = True
+            try:
+                # Migrate existing artifacts
+                artifacts_stats = self.migrate_local_to_r2()
+                
+                # Migrate existing replay artifacts
+                if self.agent_dir:
+                    replay_runs_dir = self.agent_dir / "replay_runs"
+                    if replay_runs_dir.exists():
+                        replay_stats = self.migrate_replay_artifacts_to_r2(replay_runs_dir)
+                        total_migrated = artifacts_stats["migrated"] + replay_stats["migrated"]
+                        if total_migrated > 0:
+                            print(f"[Kurral] Migrated {total_migrated} artifacts to R2")
+            except Exception as e:
+                # Don't fail save if migration fails
+                import warnings
+                warnings.warn(f"Migration warning: {e}")
+    
+    def _result_path(self, artifact: KurralArtifact, result: StorageResult) -> Path:
+        """Path returned by save() for a successful StorageResult"""
         # Return path for backward compatibility
         if result.local_path:
             return result.local_path
@@ -228,24 +280,7 @@ class ArtifactManager:
         # Migrate artifacts from artifacts/ directory
         artifacts_dir = self.storage_path
         if artifacts_dir.exists():
-            for artifact_file in artifacts_dir.glob("*.kurral"):
-                try:
-                    artifact = KurralArtifact.load(artifact_file)
-                    # Check if already in R2
-                    if self.backend.exists(artifact.kurral_id):
-                        stats["skipped"] += 1
-                        continue
-                    
-                    # Upload to R2
-                    result = self.backend.save(artifact)
-                    if result.success:
-                        stats["migrated"] += 1
-                    else:
-                        stats["errors"] += 1
-                        stats["errors_detail"].append(f"Failed to migrate {artifact.kurral_id}: {result.error}")
-                except Exception as e:
-                    stats["errors"] += 1
-                    stats["errors_detail"].append(f"Error processing {artifact_file.name}: {e}")
+            self._migrate_files(artifacts_dir.glob("*.kurral"), self.backend, stats)
         
         return stats
     
@@ -286,27 +321,58 @@ class ArtifactManager:
         if not replay_runs_dir.exists():
             return stats
         
-        for artifact_file in replay_runs_dir.glob("*.kurral"):
-            try:
-                artifact = KurralArtifact.load(artifact_file)
-                # Check if already in R2
-                if replay_backend.exists(artifact.kurral_id):
-                    stats["skipped"] += 1
-                    continue
-                
-                # Upload to R2
-                result = replay_backend.save(artifact)
-                if result.success:
-                    stats["migrated"] += 1
-                else:
-                    stats["errors"] += 1
-                    stats["errors_detail"].append(f"Failed to migrate replay {artifact.kurral_id}: {result.error}")
-            except Exception as e:
-                    stats["errors"] += 1
-                    stats["errors_detail"].append(f"Error processing replay {artifact_file.name}: {e}")
+        self._migrate_files(replay_runs_dir.glob("*.kurral"), replay_backend, stats, label="replay ")
         
         return stats
     
+    def _migrate_files(
+        self,
+        artifact_files: Iterable[Path],
+        backend: StorageBackend,
+        stats: dict,
+        label: str = ""
+    ) -> None:
+        """
+        Upload local artifact files to R2, running uploads concurrently
+        
+        Each file is an independent existence check plus upload, so the network
+        round-trips are overlapped on a bounded thread pool. Results are folded
+        into stats on the calling thread.
+        
+        Args:
+            artifact_files: Local .kurral files to migrate
+            backend: R2 storage backend to upload into
+            stats: Migration statistics dictionary to update in place
+            label: Prefix for error messages (e.g. "replay ")
+        """
+        with ThreadPoolExecutor(max_workers=MIGRATION_WORKERS) as executor:
+            futures = [
+                executor.submit(self._migrate_file, artifact_file, backend, label)
+                for artifact_file in artifact_files
+            ]
+            for future in as_completed(futures):
+                outcome, detail = future.result()
+                stats[outcome] += 1
+                if detail:
+                    stats["errors_detail"].append(detail)
+    
+    @staticmethod
+    def _migrate_file(artifact_file: Path, backend: StorageBackend, label: str) -> Tuple[str, Optional[str]]:
+        """Migrate a single artifact file, returning (stats key, error detail)"""
+        try:
+            artifact = KurralArtifact.load(artifact_file)
+            # Check if already in R2
+            if backend.exists(artifact.kurral_id):
+                return "skipped", None
+            
+            # Upload to R2
+            result = backend.save(artifact)
+            if result.success:
+                return "migrated", None
+            return "errors", f"Failed to migrate {label}{artifact.kurral_id}: {result.error}"
+        except Exception as e:
+            return "errors", f"Error processing {label}{artifact_file.name}: {e}"
+    
     def ensure_r2_migration(self, show_message: bool = True) -> dict:
         """
         Ensure all local artifacts are migrated to R2 before proceeding.
@@ -0,0 +1,181 @@
+"""
+Background artifact writer
+Saves artifacts on a worker thread so traced calls return without waiting on storage I/O
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+from kurral.models.kurral import KurralArtifact
+
+logger = logging.getLogger("kurral.async_writer")
+
+
+class AsyncArtifactWriter:
+    """
+    Saves artifacts through an ArtifactManager on a daemon worker thread
+
+    The worker starts on the first submit. When the queue is full, submit()
+    blocks until the worker catches up, so a slow backend applies
+    backpressure rather than growing memory without bound; every save still
+    happens on the worker, never concurrently with it.
+
+    Artifacts queued while a save is in progress are drained together (up
+    to MAX_BATCH) and handed to manager.save_many() when the manager has it,
+    so a burst shares one index rewrite and one metadata upsert.
+
+    submit_task() queues arbitrary work (such as building the artifact
+    itself) to run on the same thread ahead of the saves in its batch.
+
+    Failures are logged on the "kurral.async_writer" logger rather than
+    printed, so they don't land in the middle of the caller's output.
+    """
+
+    MAX_BATCH = 64
+
+    def __init__(self, max_pending: int = 1024):
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        manager: Any,
+        artifact: KurralArtifact,
+        on_saved: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Queue an artifact to be saved with manager.save(artifact)
+
+        Args:
+            manager: ArtifactManager (or anything with save(artifact))
+            artifact: Artifact to save
+            on_saved: Optional callback receiving the value returned by save()
+        """
+        self._ensure_started()
+        if threading.current_thread() is not self._thread:
+            self._queue.put((manager, artifact, on_saved))
+            return
+        # Submitted by a task on the worker: waiting for queue space here would
+        # deadlock, and saving inline when full can't race the worker
+        try:
+            self._queue.put_nowait((manager, artifact, on_saved))
+        except queue.Full:
+            self._save(manager, artifact, on_saved)
+
+    def submit_task(self, task: Callable[[], None]) -> None:
+        """
+        Queue task() to run on the worker thread
+
+        Used to move artifact generation off the caller thread as well as the
+        save; anything the task submit()s is saved on a later batch.
+
+        Args:
+            task: Callable taking no arguments; exceptions are reported, not raised
+        """
+        self._ensure_started()
+        if threading.current_thread() is self._thread:
+            self._run_task(task)
+            return
+        self._queue.put((None, task, None))
+
+    def flush(self) -> None:
+        """Block until every queued artifact has been saved"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="kurral-artifact-writer", daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._save_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _save_batch(self, batch: list) -> None:
+        # Run queued tasks first, then group saves by manager, keeping
+        # submission order within each group
+        groups: dict[int, list] = {}
+        for item in batch:
+            if item[0] is None:
+                self._run_task(item[1])
+            else:
+                groups.setdefault(id(item[0]), []).append(item)
+
+        for items in groups.values():
+            manager = items[0][0]
+            if len(items) == 1 or not hasattr(manager, "save_many"):
+                for item in items:
+                    self._save(*item)
+                continue
+
+            try:
+                saved = manager.save_many([artifact for _, artifact, _ in items])
+            except Exception:
+                # Fall back to individual saves so one bad artifact can't sink the batch
+                for item in items:
+                    self._save(*item)
+                continue
+
+            for (_, artifact, on_saved), path in zip(items, saved):
+                if path is None:
+                    logger.error("Failed to save artifact %s", artifact.kurral_id)
+                elif on_saved is not None:
+                    try:
+                        on_saved(path)
+                    except Exception as e:
+                        logger.error("Failed to save artifact %s: %s", artifact.kurral_id, e)
+
+    @staticmethod
+    def _run_task(task: Callable[[], None]) -> None:
+        try:
+            task()
+        except Exception as e:
+            logger.error("Failed to generate artifact: %s", e)
+
+    @staticmethod
+    def _save(manager: Any, artifact: KurralArtifact, on_saved: Optional[Callable[[Any], None]]) -> None:
+        try:
+            saved = manager.save(artifact)
+            if on_saved is not None:
+                on_saved(saved)
+        except Exception as e:
+            logger.error("Failed to save artifact %s: %s", artifact.kurral_id, e)
+
+
+_writer: Optional[AsyncArtifactWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_artifact_writer() -> AsyncArtifactWriter:
+    """
+    Get the shared background writer
+
+    Created on first use; pending artifacts are flushed at interpreter exit.
+    """
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                writer = AsyncArtifactWriter()
+                atexit.register(writer.flush)
+                _writer = writer
+    return _writer
@@ -2,10 +2,42 @@
 Simple cache backend for tool call responses
 """
 
+import itertools
 import json
+import os
+import sqlite3
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Collection, Iterable, Optional, Union
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# MessagePack is much cheaper to encode/decode than JSON; set
+# KURRAL_CACHE_JSON=1 to keep rows human-readable when debugging
+_USE_MSGPACK = MSGSPEC_AVAILABLE and not os.environ.get("KURRAL_CACHE_JSON")
+if MSGSPEC_AVAILABLE:
+    _msgpack_encoder = msgspec.msgpack.Encoder()
+    _msgpack_decoder = msgspec.msgpack.Decoder()
+
+# Payloads larger than this are zstd-compressed; stored frames are recognised
+# by the zstd magic number, which neither JSON nor a MessagePack map starts with
+_COMPRESS_THRESHOLD = 1024
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+if ZSTD_AVAILABLE:
+    _zstd_compressor = zstandard.ZstdCompressor(level=1)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
 
 
 class CacheBackend(ABC):
@@ -16,6 +48,11 @@ class CacheBackend(ABC):
         """Pre-populate cache with a response"""
         pass
 
+    def prime_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Pre-populate cache with many (cache_key, response) pairs"""
+        for cache_key, response in items:
+            self.prime(cache_key, response)
+
     @abstractmethod
     def get(self, cache_key: str) -> Optional[dict[str, Any]]:
         """Retrieve cached response"""
@@ -35,35 +72,268 @@ class CacheBackend(ABC):
 class MemoryCache(CacheBackend):
     """Simple in-memory cache for testing"""
 
-    def __init__(self, ttl_seconds: int = 3600):
-        """Initialize memory cache"""
+    # Entries examined per eviction, as in Redis' approximated LRU
+    EVICTION_SAMPLE_SIZE = 8
+    # Hit counters are halved once any of them reaches this value
+    MAX_HITS = 1 << 31
+
+    def __init__(self, ttl_seconds: int = 3600, max_entries: Optional[int] = None):
+        """
+        Initialize memory cache
+
+        With max_entries set, the cache evicts the least-hit entry among a small
+        sample of the oldest entries once full. Hits only bump an integer
+        counter, so reads never reorder the cache.
+        """
         self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
         self.cache: dict[str, tuple[dict[str, Any], int]] = {}
+        self._hits: dict[str, int] = {}
 
     def prime(self, cache_key: str, response: dict[str, Any]) -> None:
         """Pre-populate cache"""
         expires_at = int(time.time()) + self.ttl_seconds
         self.cache[cache_key] = (response, expires_at)
+        self._hits.setdefault(cache_key, 0)
+        self._evict_if_needed((cache_key,))
+
+    def prime_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Pre-populate cache with many responses in one update"""
+        expires_at = int(time.time()) + self.ttl_seconds
+        primed = set()
+        for cache_key, response in items:
+            self.cache[cache_key] = (response, expires_at)
+            self._hits.setdefault(cache_key, 0)
+            primed.add(cache_key)
+        self._evict_if_needed(primed)
 
     def get(self, cache_key: str) -> Optional[dict[str, Any]]:
         """Retrieve cached response"""
-        if cache_key not in self.cache:
+        # Single lock-free lookup; a concurrent evict can't split check and read
+        entry = self.cache.get(cache_key)
+        if entry is None:
             return None
 
-        response, expires_at = self.cache[cache_key]
+        response, expires_at = entry
 
         # Check expiration
         if expires_at < int(time.time()):
-            del self.cache[cache_key]
+            self.evict(cache_key)
             return None
 
+        hits = self._hits.get(cache_key, 0) + 1
+        self._hits[cache_key] = hits
+        if hits >= self.MAX_HITS:
+            self._halve_hits()
         return response
 
     def evict(self, cache_key: str) -> None:
         """Remove cache entry"""
         self.cache.pop(cache_key, None)
+        self._hits.pop(cache_key, None)
 
     def clear(self) -> None:
         """Clear all cache entries"""
         self.cache.clear()
+        self._hits.clear()
+
+    def _evict_if_needed(self, primed: Collection[str] = ()) -> None:
+        """
+        Drop the least-hit sampled entries beyond max_entries
+
+        Just-primed keys have no hits yet, so they are left out of the sample
+        unless nothing else is left to evict.
+        """
+        if self.max_entries is None:
+            return
+        while len(self.cache) > self.max_entries:
+            older = (cache_key for cache_key in self.cache if cache_key not in primed)
+            candidates = list(itertools.islice(older, self.EVICTION_SAMPLE_SIZE))
+            if not candidates:
+                candidates = list(itertools.islice(self.cache, self.EVICTION_SAMPLE_SIZE))
+            self.evict(min(candidates, key=self._hits.__getitem__))
+
+    def _halve_hits(self) -> None:
+        """Age all hit counters so old popularity decays"""
+        for cache_key in self._hits:
+            self._hits[cache_key] >>= 1
+
+
+class SQLiteCache(CacheBackend):
+    """Persistent SQLite-backed cache, reused across replay runs"""
+
+    # Fixed SQL text so sqlite3's per-connection statement cache reuses the
+    # prepared statements instead of re-parsing on every call
+    _SQL_PRIME = "INSERT OR REPLACE INTO cache (cache_key, response, expires_at) VALUES (?, ?, ?)"
+    _SQL_GET = "SELECT response, expires_at FROM cache WHERE cache_key = ?"
+    _SQL_EVICT = "DELETE FROM cache WHERE cache_key = ?"
+    _SQL_CLEAR = "DELETE FROM cache"
+    _SQL_CLEANUP = "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at < ?"
+    _SQL_STATS = "SELECT COUNT(*), COALESCE(SUM(expires_at < ?), 0) FROM cache"
+
+    # Expired rows are swept in one batched DELETE every this many writes
+    CLEANUP_INTERVAL = 1024
+    # Decoded responses kept in process for repeat reads
+    HOT_CACHE_SIZE = 512
+    # Freed pages are only returned to the OS after sweeps this large
+    VACUUM_THRESHOLD = 1000
+
+    def __init__(self, db_path: Union[str, Path] = ".kurral_cache.db", ttl_seconds: Optional[int] = None):
+        """
+        Initialize SQLite cache
+
+        Tool responses are content-addressed by cache key, so entries never go
+        stale by default (ttl_seconds=None); set a TTL to bound their lifetime.
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self._writes_since_cleanup = 0
+        self._hot: OrderedDict[str, tuple[dict[str, Any], Optional[int]]] = OrderedDict()
+        # Autocommit mode: single-statement writes commit on their own instead
+        # of going through Python's implicit BEGIN wrapping
+        self.conn = sqlite3.connect(
+            str(self.db_path), isolation_level=None, cached_statements=256
+        )
+        self._configure_pragmas()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "cache_key TEXT PRIMARY KEY, "
+            "response BLOB NOT NULL, "
+            "expires_at INTEGER)"
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_expires_at "
+            "ON cache (expires_at) WHERE expires_at IS NOT NULL"
+        )
+
+    def _configure_pragmas(self) -> None:
+        """Tune the connection for a write-heavy local cache"""
+        # Lets cleanup_expired hand freed pages back to the OS. The mode only
+        # takes effect before the first table is created (and before WAL), so
+        # it goes first; databases created without it are converted once
+        self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        if self.conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            self.conn.execute("VACUUM")
+        # WAL lets readers proceed while a write is in flight; it is not
+        # supported for in-memory databases
+        if str(self.db_path) != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL is durable under WAL except on power loss, which is fine for a cache
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        self.conn.execute("PRAGMA mmap_size=1073741824")
+        self.conn.execute("PRAGMA busy_timeout=3000")
+
+    def prime(self, cache_key: str, response: dict[str, Any]) -> None:
+        """Pre-populate cache"""
+        expires_at = int(time.time()) + self.ttl_seconds if self.ttl_seconds is not None else None
+        self.conn.execute(self._SQL_PRIME, (cache_key, self._encode(response), expires_at))
+        self._hot.pop(cache_key, None)
+        self._maybe_cleanup(1)
+
+    def prime_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Pre-populate cache with many responses in a single transaction"""
+        expires_at = int(time.time()) + self.ttl_seconds if self.ttl_seconds is not None else None
+        rows = [(cache_key, self._encode(response), expires_at) for cache_key, response in items]
+        self.conn.execute("BEGIN")
+        try:
+            self.conn.executemany(self._SQL_PRIME, rows)
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        for cache_key, _, _ in rows:
+            self._hot.pop(cache_key, None)
+        self._maybe_cleanup(len(rows))
+
+    def get(self, cache_key: str) -> Optional[dict[str, Any]]:
+        """Retrieve cached response"""
+        hot = self._hot.get(cache_key)
+        if hot is None:
+            row = self.conn.execute(self._SQL_GET, (cache_key,)).fetchone()
+            if row is None:
+                return None
+            payload, expires_at = row
+            hot = (self._decode(payload), expires_at)
+            self._hot[cache_key] = hot
+            if len(self._hot) > self.HOT_CACHE_SIZE:
+                self._hot.popitem(last=False)
+        else:
+            self._hot.move_to_end(cache_key)
+
+        response, expires_at = hot
+
+        # Check expiration (the row is left for the next batched sweep so
+        # reads never write)
+        if expires_at is not None and expires_at < int(time.time()):
+            return None
+
+        return response
+
+    def evict(self, cache_key: str) -> None:
+        """Remove cache entry"""
+        self.conn.execute(self._SQL_EVICT, (cache_key,))
+        self._hot.pop(cache_key, None)
+
+    def clear(self) -> None:
+        """Clear all cache entries"""
+        self.conn.execute(self._SQL_CLEAR)
+        self._hot.clear()
+
+    def cleanup_expired(self) -> int:
+        """Delete expired entries, returning how many were removed"""
+        cursor = self.conn.execute(self._SQL_CLEANUP, (int(time.time()),))
+        self._writes_since_cleanup = 0
+        if cursor.rowcount > self.VACUUM_THRESHOLD:
+            # executescript steps the pragma to completion; execute() would
+            # free only a single page
+            self.conn.executescript("PRAGMA incremental_vacuum;")
+        return cursor.rowcount
+
+    def _maybe_cleanup(self, writes: int) -> None:
+        """Sweep expired rows once enough writes have accumulated"""
+        if self.ttl_seconds is None:
+            return
+        self._writes_since_cleanup += writes
+        if self._writes_since_cleanup >= self.CLEANUP_INTERVAL:
+            self.cleanup_expired()
+
+    def stats(self) -> dict[str, int]:
+        """Get entry counts"""
+        now = int(time.time())
+        # One scan for both counts (NULL expires_at never counts as expired)
+        total, expired = self.conn.execute(self._SQL_STATS, (now,)).fetchone()
+        return {"total_entries": total, "expired_entries": expired, "active_entries": total - expired}
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        # Refresh query planner statistics, as SQLite recommends before closing
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
+
+    @staticmethod
+    def _encode(response: dict[str, Any]) -> Union[bytes, str]:
+        """Serialize a response as MessagePack bytes, or JSON text as a fallback"""
+        payload = _msgpack_encoder.encode(response) if _USE_MSGPACK else json.dumps(response)
+        if ZSTD_AVAILABLE and len(payload) > _COMPRESS_THRESHOLD:
+            if isinstance(payload, str):
+                payload = payload.encode("utf-8")
+            return _zstd_compressor.compress(payload)
+        return payload
 
+    @staticmethod
+    def _decode(payload: Union[bytes, str]) -> dict[str, Any]:
+        """Deserialize a stored response; TEXT rows are JSON, BLOB rows MessagePack"""
+        if isinstance(payload, str):
+            return json.loads(payload)
+        if payload.startswith(_ZSTD_MAGIC):
+            if not ZSTD_AVAILABLE:
+                raise ImportError("zstandard is required to read this cache. Install with: pip install kurral[cache]")
+            payload = _zstd_decompressor.decompress(payload)
+            # Compressed JSON (written without msgspec) is still a JSON object
+            if payload.startswith(b"{"):
+                return json.loads(payload)
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec is required to read this cache. Install with: pip install kurral[cache]")
+        return _msgpack_decoder.decode(payload)
@@ -123,14 +123,14 @@ def init(project_name, output_dir, skip_git, framework, verbose):
 
     # If no project name, use legacy behavior (just create directories)
     if not project_name:
-        import os
-        os.makedirs("artifacts", exist_ok=True)
-        os.makedirs("replay_runs", exist_ok=True)
-        os.makedirs("side_effect", exist_ok=True)
-        console.print("[green]✓[/green] Created artifacts/ directory")
-        console.print("[green]✓[/green] Created replay_runs/ directory")
-        console.print("[green]✓[/green] Created side_effect/ directory")
-        console.print("\n[bold]Kurral initialized![/bold] Add @trace_agent() to your agent.")
+        directories = ("artifacts", "replay_runs", "side_effect")
+        for directory in directories:
+            Path(directory).mkdir(exist_ok=True)
+        # One print call renders the whole summary in a single write
+        console.print(
+            "\n".join(f"[green]✓[/green] Created {directory}/ directory" for directory in directories)
+            + "\n\n[bold]Kurral initialized![/bold] Add @trace_agent() to your agent."
+        )
         return
 
     # Use new ProjectGenerator
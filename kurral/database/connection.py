@@ -2,12 +2,14 @@
 Database connection and session management for PostgreSQL/Supabase
 """
 
+import threading
 import warnings
-from typing import Optional, Generator
+from typing import Dict, Optional, Generator, Tuple
 from contextlib import contextmanager
 
 try:
     from sqlalchemy import create_engine
+    from sqlalchemy.engine import Engine
     from sqlalchemy.ext.declarative import declarative_base
     from sqlalchemy.orm import sessionmaker, Session
     from sqlalchemy.pool import NullPool
@@ -19,16 +21,56 @@ except ImportError:
 # Base will be imported from models after models is defined
 # We'll import it conditionally to avoid circular imports
 
+# Engines are shared per URL and pool settings so repeated DatabaseConnection
+# instances reuse pooled connections instead of paying a new connect/TLS
+# handshake each time
+_engines: Dict[Tuple, "Engine"] = {}
+_engines_lock = threading.Lock()
+
+
+def _get_engine(database_url: str, use_pool: bool = True, pool_size: int = 5, max_overflow: int = 10) -> "Engine":
+    """Get or create the shared engine for a database URL and pool settings"""
+    key = (database_url, pool_size, max_overflow) if use_pool else (database_url, None, None)
+    engine = _engines.get(key)
+    if engine is not None:
+        return engine
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is not None:
+            return engine
+        if use_pool:
+            engine = create_engine(
+                database_url,
+                pool_pre_ping=True,  # Verify connections before using
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_recycle=1800,  # Recycle before managed PG/Supabase idle timeouts
+                echo=False,  # Set to True for SQL debugging
+            )
+        else:
+            # No pooling, e.g. for fork-heavy workers that must not share sockets
+            engine = create_engine(
+                database_url,
+                pool_pre_ping=True,
+                poolclass=NullPool,
+                echo=False,
+            )
+        _engines[key] = engine
+    return engine
+
 
 class DatabaseConnection:
     """Manages database connection and sessions"""
     
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, use_pool: bool = True, pool_size: int = 5, max_overflow: int = 10):
         """
         Initialize database connection
         
         Args:
             database_url: PostgreSQL connection string
+            use_pool: Keep a connection pool (set False to open a fresh connection per session)
+            pool_size: Connections kept open in the pool
+            max_overflow: Extra connections allowed beyond pool_size under load
         """
         if not SQLALCHEMY_AVAILABLE:
             raise ImportError(
@@ -38,16 +80,9 @@ class DatabaseConnection:
         
         self.database_url = database_url
         
-        # Create engine with connection pooling
-        # Use NullPool for simple use cases (no connection pooling)
-        # For production, consider using connection pooling
+        # Shared engine with connection pooling
         try:
-            self.engine = create_engine(
-                database_url,
-                pool_pre_ping=True,  # Verify connections before using
-                poolclass=NullPool,  # Simple connection management
-                echo=False,  # Set to True for SQL debugging
-            )
+            self.engine = _get_engine(database_url, use_pool, pool_size, max_overflow)
         except Exception as e:
             raise RuntimeError(f"Failed to create database engine: {e}")
         
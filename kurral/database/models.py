@@ -89,6 +89,8 @@ if SQLALCHEMY_AVAILABLE and Base:
         # Indexes for common queries
         __table_args__ = (
             Index("idx_tenant_env", "tenant_id", "environment"),
+            # Tenant timeline: filter by tenant, newest first, without a sort step
+            Index("idx_tenant_created_desc", tenant_id, created_at.desc()),
             Index("idx_created_desc", "created_at"),
             Index("idx_deterministic_level", "deterministic", "replay_level"),
             Index("idx_semantic_buckets", "semantic_buckets", postgresql_using="gin"),
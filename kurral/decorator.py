@@ -3,6 +3,7 @@ trace_llm decorator for automatic artifact generation
 """
 import functools
 import inspect
+import logging
 import time
 import os
 from datetime import datetime
@@ -18,9 +19,25 @@ from kurral.models.kurral import (
 )
 from kurral.artifact_manager import ArtifactManager
 from kurral.artifact_generator import ArtifactGenerator
+from kurral.async_writer import get_artifact_writer
 
 T = TypeVar("T")
 
+logger = logging.getLogger("kurral.decorator")
+
+# One ArtifactManager per (artifacts dir, agent dir): managers load storage
+# config on creation, and sharing them lets the background writer batch saves
+_artifact_managers: dict[tuple[Path, Optional[Path]], ArtifactManager] = {}
+
+
+def _get_artifact_manager(storage_path: Path, agent_dir: Optional[Path]) -> ArtifactManager:
+    """Get the shared ArtifactManager for an artifacts directory"""
+    key = (storage_path, agent_dir)
+    manager = _artifact_managers.get(key)
+    if manager is None:
+        manager = _artifact_managers[key] = ArtifactManager(storage_path=storage_path, agent_dir=agent_dir)
+    return manager
+
 
 class TraceContext:
     """Context for capturing trace data during execution"""
@@ -283,6 +300,7 @@ def _generate_and_export_artifact(
     export_path: Optional[str],
     artifacts_dir: Optional[str] = None,
     caller_file_path: Optional[str] = None,
+    on_saved: Optional[Callable[[Any, str], None]] = None,
 ) -> tuple[Any, Optional[str]]:
     """Generate artifact and export to storage
     
@@ -292,6 +310,8 @@ def _generate_and_export_artifact(
         export_path: Optional explicit path to save artifact
         artifacts_dir: Optional explicit artifacts directory (deprecated, use caller_file_path)
         caller_file_path: Path to the file calling the decorator (used to determine agent folder)
+        on_saved: If given, storage saves run on the background writer and this is
+            called with (artifact, saved_path); the returned path is then None
     """
     generator = ArtifactGenerator()
 
@@ -352,11 +372,11 @@ def _generate_and_export_artifact(
         
         # Use ArtifactManager with config loading from agent directory
         agent_dir = Path(caller_file_path).parent.resolve() if caller_file_path else None
-        manager = ArtifactManager(
-            storage_path=Path(artifacts_dir),
-            agent_dir=agent_dir
-        )
-        saved_path = str(manager.save(artifact))
+        manager = _get_artifact_manager(Path(artifacts_dir), agent_dir)
+        if on_saved is not None:
+            get_artifact_writer().submit(manager, artifact, lambda path: on_saved(artifact, str(path)))
+        else:
+            saved_path = str(manager.save(artifact))
 
     return artifact, saved_path
 
@@ -368,6 +388,7 @@ def trace_llm(
     auto_export: bool = True,
     export_path: Optional[str] = None,
     llm_config: Optional[ModelConfig] = None,
+    min_tool_calls: int = 0,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator to trace LLM function calls and generate .kurral artifacts
@@ -380,6 +401,8 @@ def trace_llm(
     
     Args:
         llm_config: Optional ModelConfig to use (if not provided, will try to extract from LLM objects)
+        min_tool_calls: Skip the artifact for successful calls that captured fewer tool
+            calls than this (failed calls are always exported)
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
@@ -423,7 +446,7 @@ def trace_llm(
                 context.llm_config = llm_config
 
             # Start timing
-            start_ms = time.time() * 1000
+            start_ns = time.perf_counter_ns()
 
             try:
                 # Execute function
@@ -439,6 +462,9 @@ def trace_llm(
                         tool_calls_list = []
                         for tc in result.get("tool_calls", []):
                             if isinstance(tc, dict):
+                                # Only fall back to the current time when the call
+                                # has no timestamp (no format/parse round-trip)
+                                timestamp = tc.get("timestamp")
                                 tool_call = ToolCall(
                                     tool_name=tc.get("tool_name", "unknown"),
                                     inputs=tc.get("inputs", {}),
@@ -447,7 +473,7 @@ def trace_llm(
                                         tc.get("tool_name", "unknown"),
                                         tc.get("inputs", {})
                                     ),
-                                    timestamp=datetime.fromisoformat(tc.get("timestamp", datetime.utcnow().isoformat())),
+                                    timestamp=datetime.fromisoformat(timestamp) if timestamp is not None else datetime.utcnow(),
                                 )
                                 tool_calls_list.append(tool_call)
                         context.tool_calls = tool_calls_list
@@ -491,24 +517,36 @@ def trace_llm(
                     context.prompt = _extract_prompt_from_args(kwargs)
 
                 # Stop timing
-                duration_ms = int(time.time() * 1000 - start_ms)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-                # Generate artifact
-                if auto_export:
+                # Generate artifact; for successful runs both generation and the
+                # save happen on the background writer, so the result is returned
+                # without waiting on artifact validation or storage I/O. The
+                # context isn't touched again on this thread once handed off.
+                if auto_export and len(context.tool_calls) >= min_tool_calls:
                     # Get the file path of the function being decorated
                     caller_file = inspect.getfile(func)
-                    artifact, saved_path = _generate_and_export_artifact(
-                        context, duration_ms, export_path, caller_file_path=caller_file
-                    )
-                    print(f"\n[SUCCESS] Kurral artifact saved to: {saved_path}")
-                    print(f"  Kurral ID: {artifact.kurral_id}")
-                    print(f"  Note: Replay level will be determined during replay (A or B)")
+                    
+                    # Runs on the background writer, so it logs instead of
+                    # printing over the caller's output
+                    def report_saved(artifact: Any, saved_path: str) -> None:
+                        logger.info("Kurral artifact %s saved to: %s", artifact.kurral_id, saved_path)
+                    
+                    def export() -> None:
+                        artifact, saved_path = _generate_and_export_artifact(
+                            context, duration_ms, export_path, caller_file_path=caller_file,
+                            on_saved=report_saved,
+                        )
+                        if saved_path is not None:
+                            report_saved(artifact, saved_path)
+                    
+                    get_artifact_writer().submit_task(export)
 
                 return result
 
             except Exception as e:
                 context.error = str(e)
-                duration_ms = int(time.time() * 1000 - start_ms)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
                 # Still try to export even on error
                 if auto_export:
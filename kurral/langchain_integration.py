@@ -3,8 +3,10 @@ LangChain integration helpers for Kurral
 Provides utilities for capturing tool calls, extracting LLM configs, and computing graph versions
 """
 
+import functools
 import hashlib
 import json
+import time
 from datetime import datetime
 from typing import Any, Optional, List, Dict
 from langchain.agents import AgentExecutor
@@ -23,6 +25,24 @@ from kurral.models.kurral import (
 )
 
 
+def _to_payload_dict(value: Any, key: str) -> Dict[str, Any]:
+    """
+    Normalize a tool input/output into a dict
+    
+    Dicts are returned as-is; strings are only parsed when they look like a JSON
+    object, so plain-text results never pay for a failed json.loads attempt.
+    Anything else is wrapped as {key: value}.
+    """
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str) and value.lstrip().startswith("{"):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return {key: value}
+
+
 class ToolCallCaptureHandler(BaseCallbackHandler):
     """Callback handler to capture tool calls from LangChain AgentExecutor"""
     
@@ -30,6 +50,7 @@ class ToolCallCaptureHandler(BaseCallbackHandler):
         super().__init__()
         self.tool_calls: List[ToolCall] = []
         self.current_tool_start: Optional[datetime] = None
+        self._tool_start_ns: int = 0  # Monotonic start for latency measurement
         self.current_tool_name: Optional[str] = None
         self.current_tool_input: Optional[dict] = None
     
@@ -45,18 +66,11 @@ class ToolCallCaptureHandler(BaseCallbackHandler):
         """Called when a tool starts executing"""
         tool_name = serialized.get("name", "unknown")
         self.current_tool_start = datetime.utcnow()
+        self._tool_start_ns = time.perf_counter_ns()
         self.current_tool_name = tool_name
         
-        # Parse input_str to dict if possible
-        try:
-            # Try to parse as JSON
-            if input_str.strip().startswith("{"):
-                self.current_tool_input = json.loads(input_str)
-            else:
-                # For simple string inputs, wrap in dict
-                self.current_tool_input = {"input": input_str}
-        except:
-            self.current_tool_input = {"input": input_str}
+        # Parse input_str to dict if possible (simple string inputs are wrapped)
+        self.current_tool_input = _to_payload_dict(input_str, "input")
     
     def on_tool_end(
         self,
@@ -71,18 +85,12 @@ class ToolCallCaptureHandler(BaseCallbackHandler):
             return
         
         end_time = datetime.utcnow()
-        latency_ms = int((end_time - self.current_tool_start).total_seconds() * 1000)
+        latency_ms = (time.perf_counter_ns() - self._tool_start_ns) // 1_000_000
         
         # Parse output to dict if possible
-        try:
-            if output.strip().startswith("{"):
-                tool_output = json.loads(output)
-            else:
-                tool_output = {"output": output}
-        except:
-            tool_output = {"output": output}
+        tool_output = _to_payload_dict(output, "output")
         
-        # Create ToolCall
+        # Create ToolCall (the model validator derives cache_key and hashes once)
         tool_call = ToolCall(
             tool_name=self.current_tool_name,
             input=self.current_tool_input or {},
@@ -93,16 +101,11 @@ class ToolCallCaptureHandler(BaseCallbackHandler):
             status=ToolCallStatus.OK,
         )
         
-        # Generate cache key
-        tool_call.cache_key = ToolCall.generate_cache_key(
-            self.current_tool_name,
-            self.current_tool_input or {}
-        )
-        
         self.tool_calls.append(tool_call)
         
         # Reset current tool state
         self.current_tool_start = None
+        self._tool_start_ns = 0
         self.current_tool_name = None
         self.current_tool_input = None
     
@@ -119,7 +122,7 @@ class ToolCallCaptureHandler(BaseCallbackHandler):
             return
         
         end_time = datetime.utcnow()
-        latency_ms = int((end_time - self.current_tool_start).total_seconds() * 1000)
+        latency_ms = (time.perf_counter_ns() - self._tool_start_ns) // 1_000_000
         
         tool_call = ToolCall(
             tool_name=self.current_tool_name,
@@ -133,15 +136,11 @@ class ToolCallCaptureHandler(BaseCallbackHandler):
             error_text=str(error),
         )
         
-        tool_call.cache_key = ToolCall.generate_cache_key(
-            self.current_tool_name,
-            self.current_tool_input or {}
-        )
-        
         self.tool_calls.append(tool_call)
         
         # Reset current tool state
         self.current_tool_start = None
+        self._tool_start_ns = 0
         self.current_tool_name = None
         self.current_tool_input = None
 
@@ -229,7 +228,7 @@ def extract_resolved_prompt(agent_executor: AgentExecutor, user_input: str) -> R
                         for var in prompt_obj.input_variables:
                             if var not in variables:
                                 variables[var] = ""
-        except:
+        except Exception:
             pass
         
         # Method 2: Try to extract from the agent's runnable (for other agent types)
@@ -245,7 +244,7 @@ def extract_resolved_prompt(agent_executor: AgentExecutor, user_input: str) -> R
                             for var in prompt.input_variables:
                                 if var not in variables:
                                     variables[var] = ""
-            except:
+            except Exception:
                 pass
         
         # Method 3: Try to find prompt recursively in the runnable structure
@@ -276,7 +275,7 @@ def extract_resolved_prompt(agent_executor: AgentExecutor, user_input: str) -> R
                             result = find_prompt_recursive(item, depth+1, max_depth)
                             if result:
                                 return result
-                    except:
+                    except Exception:
                         pass
                 
                 return None
@@ -317,6 +316,31 @@ def extract_resolved_prompt(agent_executor: AgentExecutor, user_input: str) -> R
     return resolved
 
 
+@functools.lru_cache(maxsize=256)
+def _tool_schema_json(tool_name: str, tool_desc: str, args_schema: Any) -> str:
+    """
+    Serialize one tool's schema representation (sorted keys)
+    
+    Cached because tools and their args_schema classes don't change between
+    invokes, and model_json_schema() is far costlier than the hashing itself.
+    """
+    # Get input schema
+    input_schema = {}
+    try:
+        if args_schema:
+            input_schema = args_schema.model_json_schema() if hasattr(args_schema, "model_json_schema") else {}
+    except Exception:
+        pass
+    
+    # Create schema representation
+    schema_repr = {
+        "name": tool_name,
+        "description": tool_desc,
+        "input_schema": input_schema,
+    }
+    return json.dumps(schema_repr, sort_keys=True)
+
+
 def compute_tool_schemas_hash(tools: List[BaseTool]) -> str:
     """
     Compute hash of tool schemas (name + description + input schema)
@@ -332,26 +356,17 @@ def compute_tool_schemas_hash(tools: List[BaseTool]) -> str:
     for tool in tools:
         tool_name = getattr(tool, "name", "unknown")
         tool_desc = getattr(tool, "description", "")
+        args_schema = getattr(tool, "args_schema", None)
         
-        # Get input schema
-        input_schema = {}
-        if hasattr(tool, "args_schema"):
-            try:
-                if tool.args_schema:
-                    input_schema = tool.args_schema.model_json_schema() if hasattr(tool.args_schema, "model_json_schema") else {}
-            except:
-                pass
-        
-        # Create schema representation
-        schema_repr = {
-            "name": tool_name,
-            "description": tool_desc,
-            "input_schema": input_schema,
-        }
-        schemas.append(schema_repr)
+        try:
+            schemas.append(_tool_schema_json(tool_name, tool_desc, args_schema))
+        except TypeError:
+            # Unhashable args_schema (e.g. a plain dict): serialize uncached
+            schemas.append(_tool_schema_json.__wrapped__(tool_name, tool_desc, args_schema))
     
-    # Sort for deterministic hashing
-    schemas_str = json.dumps(schemas, sort_keys=True)
+    # Same bytes as json.dumps(schemas, sort_keys=True) over the whole list,
+    # so hashes stay comparable with previously recorded artifacts
+    schemas_str = "[" + ", ".join(schemas) + "]"
     return hashlib.sha256(schemas_str.encode()).hexdigest()
 
 
@@ -4,11 +4,13 @@ MCP Capture Engine
 Captures MCP requests and responses for Kurral artifacts.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Tuple
 from datetime import datetime
 import time
 import logging
 
+from pydantic_core import to_json
+
 from kurral.mcp.models import (
     JSONRPCRequest,
     JSONRPCResponse,
@@ -94,7 +96,7 @@ class MCPCaptureEngine:
 
         # Check if we should capture this
         if not self.should_capture(request.method, tool_name):
-            logger.debug(f"Skipping capture for {request.method}")
+            logger.debug("Skipping capture for %s", request.method)
             return None
 
         # Store pending call
@@ -108,7 +110,7 @@ class MCPCaptureEngine:
             "request_id": str(request.id)
         }
 
-        logger.debug(f"Capturing request: {request.method} / {tool_name}")
+        logger.debug("Capturing request: %s / %s", request.method, tool_name)
         return tracking_id
 
     def capture_response(
@@ -121,7 +123,7 @@ class MCPCaptureEngine:
         Returns the complete captured call.
         """
         if tracking_id not in self._pending_calls:
-            logger.warning(f"No pending call found for tracking_id: {tracking_id}")
+            logger.warning("No pending call found for tracking_id: %s", tracking_id)
             return None
 
         pending = self._pending_calls.pop(tracking_id)
@@ -153,8 +155,10 @@ class MCPCaptureEngine:
         self.session.add_call(captured)
 
         logger.info(
-            f"Captured MCP call: {captured.tool_name or captured.method} "
-            f"({duration_ms}ms) -> {'error' if captured.error else 'success'}"
+            "Captured MCP call: %s (%sms) -> %s",
+            captured.tool_name or captured.method,
+            duration_ms,
+            "error" if captured.error else "success",
         )
 
         return captured
@@ -174,11 +178,42 @@ class MCPCaptureEngine:
             event_data: The parsed event data (JSON or raw string)
             event_type: The SSE event type (default: "message")
         """
-        if tracking_id not in self._pending_calls:
-            logger.warning(f"No pending call found for tracking_id: {tracking_id}")
+        pending = self._pending_stream(tracking_id)
+        if pending is None:
             return
 
-        pending = self._pending_calls[tracking_id]
+        self._append_event(pending, event_data, event_type, datetime.utcnow())
+
+    def capture_events(
+        self,
+        tracking_id: str,
+        events: Iterable[Tuple[str, Any]]
+    ) -> None:
+        """
+        Capture several SSE events for a pending call at once.
+        Used when a chunk of the stream yields more than one event; the
+        pending call is looked up once and the events share a timestamp.
+
+        Args:
+            tracking_id: The tracking ID from capture_request
+            events: (event_type, event_data) pairs, in stream order
+        """
+        pending = self._pending_stream(tracking_id)
+        if pending is None:
+            return
+
+        timestamp = datetime.utcnow()
+        for event_type, event_data in events:
+            if not self._append_event(pending, event_data, event_type, timestamp):
+                # Event limit reached; the rest would be dropped as well
+                break
+
+    def _pending_stream(self, tracking_id: str) -> Optional[dict]:
+        """Get the pending call for tracking_id, marking it as an SSE stream."""
+        pending = self._pending_calls.get(tracking_id)
+        if pending is None:
+            logger.warning("No pending call found for tracking_id: %s", tracking_id)
+            return None
 
         # Initialize events list if not exists
         if "events" not in pending:
@@ -187,22 +222,39 @@ class MCPCaptureEngine:
             # Capture time to first event
             pending["first_event_time"] = time.time()
 
+        return pending
+
+    def _append_event(
+        self,
+        pending: dict,
+        event_data: Any,
+        event_type: str,
+        timestamp: datetime
+    ) -> bool:
+        """
+        Append one event to a pending call, applying the capture limits.
+        Returns False if the event was dropped because the call is full.
+        """
         # Check event count limit (v0.3.1)
         current_count = len(pending["events"])
         if current_count >= self.config.capture.max_events_per_call:
             logger.error(
-                f"Event limit exceeded for {pending.get('tool_name', pending['method'])} "
-                f"({current_count}/{self.config.capture.max_events_per_call}), dropping event"
+                "Event limit exceeded for %s (%s/%s), dropping event",
+                pending.get("tool_name", pending["method"]),
+                current_count,
+                self.config.capture.max_events_per_call,
             )
-            return
+            return False
 
-        # Check event size limit (v0.3.1)
-        import json
-        event_size_kb = len(json.dumps(event_data).encode()) / 1024
+        # Check event size limit (v0.3.1); measured on pydantic-core's compact
+        # UTF-8 encoding, which skips building an intermediate str
+        event_size_kb = len(to_json(event_data)) / 1024
         if event_size_kb > self.config.capture.max_event_size_kb:
             logger.warning(
-                f"Event too large for {pending.get('tool_name', pending['method'])} "
-                f"({event_size_kb:.1f}KB > {self.config.capture.max_event_size_kb}KB), truncating"
+                "Event too large for %s (%.1fKB > %sKB), truncating",
+                pending.get("tool_name", pending["method"]),
+                event_size_kb,
+                self.config.capture.max_event_size_kb,
             )
             event_data = {
                 "truncated": True,
@@ -213,19 +265,26 @@ class MCPCaptureEngine:
         # Warn if approaching limit
         if current_count == self.config.capture.warn_threshold:
             logger.warning(
-                f"Event count warning for {pending.get('tool_name', pending['method'])}: "
-                f"{current_count} events captured (limit: {self.config.capture.max_events_per_call})"
+                "Event count warning for %s: %s events captured (limit: %s)",
+                pending.get("tool_name", pending["method"]),
+                current_count,
+                self.config.capture.max_events_per_call,
             )
 
         # Append this event
         event = MCPEvent(
             event_type=event_type,
             data=event_data,
-            timestamp=datetime.utcnow()
+            timestamp=timestamp
         )
         pending["events"].append(event)
 
-        logger.debug(f"Captured SSE event ({event_type}) for {pending.get('tool_name', pending['method'])}")
+        logger.debug(
+            "Captured SSE event (%s) for %s",
+            event_type,
+            pending.get("tool_name", pending["method"]),
+        )
+        return True
 
     def finalize_capture(self, tracking_id: str) -> Optional[CapturedMCPCall]:
         """
@@ -239,7 +298,7 @@ class MCPCaptureEngine:
             The complete captured call
         """
         if tracking_id not in self._pending_calls:
-            logger.warning(f"No pending call found for tracking_id: {tracking_id}")
+            logger.warning("No pending call found for tracking_id: %s", tracking_id)
             return None
 
         pending = self._pending_calls.pop(tracking_id)
@@ -293,8 +352,11 @@ class MCPCaptureEngine:
         self.session.add_call(captured)
 
         logger.info(
-            f"Finalized MCP call: {captured.tool_name or captured.method} "
-            f"({duration_ms}ms, {len(events)} events) -> {'error' if captured.error else 'success'}"
+            "Finalized MCP call: %s (%sms, %s events) -> %s",
+            captured.tool_name or captured.method,
+            duration_ms,
+            len(events),
+            "error" if captured.error else "success",
         )
 
         return captured
@@ -89,13 +89,20 @@ class CapturedMCPCall(BaseModel):
 
     def to_cache_key(self) -> str:
         """Generate a cache key for replay matching."""
-        key_data = {
-            "method": self.method,
-            "tool_name": self.tool_name,
-            "arguments": self.arguments
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_str.encode()).hexdigest()[:16]
+        return mcp_cache_key(self.method, self.tool_name, self.arguments)
+
+
+def mcp_cache_key(method: str, tool_name: Optional[str], arguments: Dict[str, Any]) -> str:
+    """
+    Cache key for replay matching, shared by captured calls and incoming requests.
+    """
+    key_data = {
+        "method": method,
+        "tool_name": tool_name,
+        "arguments": arguments
+    }
+    key_str = json.dumps(key_data, sort_keys=True)
+    return hashlib.blake2b(key_str.encode(), digest_size=8).hexdigest()
 
 
 class MCPSession(BaseModel):
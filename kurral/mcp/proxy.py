@@ -5,11 +5,15 @@ Main proxy server that intercepts all MCP traffic, captures for artifacts, and e
 """
 
 import asyncio
+import importlib.util
 import json
 import logging
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 from pathlib import Path
 
+from pydantic_core import from_json
+
 if TYPE_CHECKING:
     from fastapi import Response
     from fastapi.responses import StreamingResponse
@@ -26,7 +30,7 @@ except ImportError:
     Response = None  # type: ignore
     StreamingResponse = None  # type: ignore
 
-from kurral.mcp.config import MCPConfig
+from kurral.mcp.config import MCPConfig, ServerConfig
 from kurral.mcp.models import JSONRPCRequest, JSONRPCResponse, JSONRPCError
 from kurral.mcp.capture import MCPCaptureEngine
 from kurral.mcp.router import MCPRouter
@@ -34,6 +38,9 @@ from kurral.mcp.replay import MCPReplayEngine
 
 logger = logging.getLogger("kurral.mcp.proxy")
 
+# HTTP/2 upstream multiplexing needs the optional h2 package (pip install httpx[http2])
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class KurralMCPProxy:
     """
@@ -49,11 +56,16 @@ class KurralMCPProxy:
             )
 
         self.config = config
-        self.app = FastAPI(title="Kurral MCP Proxy")
+        self.app = FastAPI(title="Kurral MCP Proxy", lifespan=self._lifespan)
 
         # Initialize concurrency control (v0.3.1)
         self._semaphore = asyncio.Semaphore(config.proxy.max_concurrent_requests)
 
+        # Shared upstream client, opened and closed with each app lifespan
+        self._http_client: Optional["httpx.AsyncClient"] = None
+        # Parsed upstream URL + merged headers per server, built on first use
+        self._upstream_targets: Dict[str, Tuple["httpx.URL", "httpx.Headers"]] = {}
+
         # Initialize components
         self.router = MCPRouter(config)
         self.capture_engine = MCPCaptureEngine(config)
@@ -66,6 +78,42 @@ class KurralMCPProxy:
         # Setup routes
         self._setup_routes()
 
+    def _new_http_client(self) -> "httpx.AsyncClient":
+        """
+        Build the upstream client: keep-alive connections are reused across
+        requests instead of paying connection/TLS setup on every forwarded call.
+        """
+        return httpx.AsyncClient(
+            http2=H2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=self.config.proxy.max_concurrent_requests,
+                max_keepalive_connections=self.config.proxy.max_concurrent_requests,
+            ),
+        )
+
+    @asynccontextmanager
+    async def _lifespan(self, app: "FastAPI"):
+        """Open the shared upstream client for the server's lifetime."""
+        # A fresh client per lifespan, so the app can be started again
+        # (restarts, repeated TestClient contexts) after a shutdown
+        self._http_client = self._new_http_client()
+        try:
+            yield
+        finally:
+            await self._http_client.aclose()
+
+    def _upstream_target(
+        self, server_name: str, server_config: ServerConfig
+    ) -> Tuple["httpx.URL", "httpx.Headers"]:
+        """Get the prebuilt URL and headers for an upstream server."""
+        target = self._upstream_targets.get(server_name)
+        if target is None:
+            headers = httpx.Headers(server_config.headers)
+            headers["Content-Type"] = "application/json"
+            target = (httpx.URL(server_config.url), headers)
+            self._upstream_targets[server_name] = target
+        return target
+
     def _load_replay_artifact(self, artifact_path: str):
         """Load artifact for replay mode."""
         path = Path(artifact_path)
@@ -76,7 +124,7 @@ class KurralMCPProxy:
             artifact_data = json.load(f)
 
         self.replay_engine = MCPReplayEngine(self.config, artifact_data)
-        logger.info(f"Loaded replay artifact: {artifact_path}")
+        logger.info("Loaded replay artifact: %s", artifact_path)
 
     def _setup_routes(self):
         """Setup FastAPI routes."""
@@ -189,39 +237,39 @@ class KurralMCPProxy:
         tracking_id = self.capture_engine.capture_request(request, server_name)
 
         try:
-            # Forward to upstream
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    server_config.url,
-                    json=request.model_dump(),
-                    headers=server_config.headers,
-                    timeout=server_config.timeout
-                )
+            # Forward to upstream (body serialized by pydantic-core, URL/headers prebuilt)
+            url, headers = self._upstream_target(server_name, server_config)
+            response = await self._http_client.post(
+                url,
+                content=request.model_dump_json(),
+                headers=headers,
+                timeout=server_config.timeout
+            )
 
-                # Check if SSE response
-                content_type = response.headers.get("content-type", "")
+            # Check if SSE response
+            content_type = response.headers.get("content-type", "")
 
-                if "text/event-stream" in content_type:
-                    # Handle SSE streaming response
-                    return await self._handle_sse_response(
-                        response, request, tracking_id
-                    )
-                else:
-                    # Handle regular JSON response
-                    response_data = response.json()
-                    rpc_response = JSONRPCResponse(**response_data)
+            if "text/event-stream" in content_type:
+                # Handle SSE streaming response
+                return await self._handle_sse_response(
+                    response, request, tracking_id
+                )
+            else:
+                # Handle regular JSON response
+                response_data = response.json()
+                rpc_response = JSONRPCResponse(**response_data)
 
-                    # Capture response
-                    if tracking_id:
-                        self.capture_engine.capture_response(tracking_id, rpc_response)
+                # Capture response
+                if tracking_id:
+                    self.capture_engine.capture_response(tracking_id, rpc_response)
 
-                    return Response(
-                        content=json.dumps(response_data),
-                        media_type="application/json"
-                    )
+                return Response(
+                    content=json.dumps(response_data),
+                    media_type="application/json"
+                )
 
         except Exception as e:
-            logger.error(f"Error forwarding request: {e}")
+            logger.error("Error forwarding request: %s", e)
             error_response = JSONRPCResponse(
                 id=request.id,
                 error=JSONRPCError(code=-32603, message=str(e), data=None)
@@ -264,8 +312,8 @@ class KurralMCPProxy:
                             if line.startswith("data: "):
                                 # Attempt to parse as JSON for the capture engine
                                 try:
-                                    data_payload = json.loads(line[6:])
-                                except json.JSONDecodeError:
+                                    data_payload = from_json(line[6:])
+                                except ValueError:
                                     # Fallback for raw text data events
                                     data_payload = line[6:]
 
@@ -284,7 +332,7 @@ class KurralMCPProxy:
 
             except Exception as e:
                 # Log the error and potentially send an error event to the client
-                logger.error(f"Stream error encountered: {e}")
+                logger.error("Stream error encountered: %s", e)
                 yield f"event: error\ndata: {json.dumps({'error': str(e), 'code': -32000})}\n\n"
 
             finally:
@@ -385,7 +433,7 @@ class KurralMCPProxy:
                 "Use 127.0.0.1 for local development."
             )
 
-        logger.info(f"Starting Kurral MCP Proxy on {host}:{port} (mode: {self.config.mode})")
+        logger.info("Starting Kurral MCP Proxy on %s:%s (mode: %s)", host, port, self.config.mode)
         uvicorn.run(self.app, host=host, port=port)
 
 
@@ -4,15 +4,26 @@ MCP Replay Engine
 Handles replay mode: returns cached responses instead of calling real servers.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 import json
 
-from kurral.mcp.models import JSONRPCRequest, JSONRPCResponse, CapturedMCPCall, JSONRPCError
+from pydantic import TypeAdapter
+
+from kurral.mcp.models import (
+    JSONRPCRequest,
+    JSONRPCResponse,
+    CapturedMCPCall,
+    JSONRPCError,
+    mcp_cache_key,
+)
 from kurral.mcp.config import MCPConfig, ReplayConfig
 
 logger = logging.getLogger("kurral.mcp.replay")
 
+# Built once: validates a whole list of calls (and their events) in a single pass
+_CALLS_ADAPTER = TypeAdapter(List[CapturedMCPCall])
+
 
 class MCPReplayEngine:
     """
@@ -27,8 +38,10 @@ class MCPReplayEngine:
         self.cached_calls: List[CapturedMCPCall] = []
         self._load_artifact(artifact_data)
 
-        # Build lookup index
+        # Build lookup indexes
         self._cache_index: Dict[str, CapturedMCPCall] = {}
+        # method -> [(tool_name, canonical arguments JSON, call)] for semantic matching
+        self._semantic_index: Dict[str, List[Tuple[Optional[str], str, CapturedMCPCall]]] = {}
         self._build_index()
 
         # Track replay stats
@@ -44,21 +57,24 @@ class MCPReplayEngine:
         # and new format (mcp_tool_calls)
 
         if "mcp_tool_calls" in artifact_data:
-            for call_data in artifact_data["mcp_tool_calls"]:
-                self.cached_calls.append(CapturedMCPCall(**call_data))
+            self.cached_calls = _CALLS_ADAPTER.validate_python(artifact_data["mcp_tool_calls"])
 
         elif "tool_calls" in artifact_data:
-            for call_data in artifact_data["tool_calls"]:
-                if call_data.get("source") == "mcp":
-                    self.cached_calls.append(CapturedMCPCall(**call_data))
+            self.cached_calls = _CALLS_ADAPTER.validate_python([
+                call_data for call_data in artifact_data["tool_calls"]
+                if call_data.get("source") == "mcp"
+            ])
 
-        logger.info(f"Loaded {len(self.cached_calls)} cached MCP calls for replay")
+        logger.info("Loaded %d cached MCP calls for replay", len(self.cached_calls))
 
     def _build_index(self):
         """Build cache key index for fast lookups."""
         for call in self.cached_calls:
             key = call.to_cache_key()
             self._cache_index[key] = call
+            self._semantic_index.setdefault(call.method, []).append(
+                (call.tool_name, json.dumps(call.arguments, sort_keys=True), call)
+            )
 
     def find_cached_response(
         self,
@@ -84,7 +100,7 @@ class MCPReplayEngine:
         if cache_key in self._cache_index:
             cached = self._cache_index[cache_key]
             self.stats["cache_hits"] += 1
-            logger.info(f"Cache HIT (exact): {tool_name or request.method}")
+            logger.info("Cache HIT (exact): %s", tool_name or request.method)
             return self._build_response(request.id, cached)
 
         # Try semantic matching
@@ -94,12 +110,12 @@ class MCPReplayEngine:
             )
             if semantic_match:
                 self.stats["semantic_matches"] += 1
-                logger.info(f"Cache HIT (semantic): {tool_name or request.method}")
+                logger.info("Cache HIT (semantic): %s", tool_name or request.method)
                 return self._build_response(request.id, semantic_match)
 
         # Cache miss
         self.stats["cache_misses"] += 1
-        logger.warning(f"Cache MISS: {tool_name or request.method}")
+        logger.warning("Cache MISS: %s", tool_name or request.method)
         return self._handle_cache_miss(request)
 
     def _compute_cache_key(
@@ -109,14 +125,7 @@ class MCPReplayEngine:
         arguments: Dict
     ) -> str:
         """Compute cache key for a request."""
-        import hashlib
-        key_data = {
-            "method": method,
-            "tool_name": tool_name,
-            "arguments": arguments
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_str.encode()).hexdigest()[:16]
+        return mcp_cache_key(method, tool_name, arguments)
 
     def _find_semantic_match(
         self,
@@ -136,21 +145,17 @@ class MCPReplayEngine:
 
         best_match = None
         best_score = 0.0
+        arguments_json = json.dumps(arguments, sort_keys=True)
 
-        for cached in self.cached_calls:
-            # Must match method
-            if cached.method != method:
-                continue
-
+        # Must match method (candidates are pre-grouped by method, with
+        # their arguments already serialized)
+        for cached_tool_name, cached_arguments_json, cached in self._semantic_index.get(method, ()):
             # Must match tool name if present
-            if tool_name and cached.tool_name != tool_name:
+            if tool_name and cached_tool_name != tool_name:
                 continue
 
             # Compute argument similarity
-            score = compute_similarity(
-                json.dumps(arguments, sort_keys=True),
-                json.dumps(cached.arguments, sort_keys=True)
-            )
+            score = compute_similarity(arguments_json, cached_arguments_json)
 
             if score >= self.replay_config.semantic_threshold and score > best_score:
                 best_match = cached
@@ -53,10 +53,10 @@ class MCPRouter:
                             if tool_name:
                                 self._tool_to_server[tool_name] = server_name
 
-                logger.info(f"Discovered {len(self._tool_to_server)} tools from {server_name}")
+                logger.info("Discovered %d tools from %s", len(self._tool_to_server), server_name)
 
             except Exception as e:
-                logger.warning(f"Failed to discover tools from {server_name}: {e}")
+                logger.warning("Failed to discover tools from %s: %s", server_name, e)
 
     def route(self, request: JSONRPCRequest) -> Optional[ServerConfig]:
         """
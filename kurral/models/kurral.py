@@ -5,7 +5,7 @@ Copied from kurral-cli for independent operation
 
 import json
 import hashlib
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional, List, Union
@@ -136,7 +136,7 @@ class ResolvedPrompt(BaseModel):
                     continue
                 try:
                     result[str(k)] = ResolvedPrompt._make_serializable(v, max_depth, current_depth + 1)
-                except:
+                except Exception:
                     result[str(k)] = f"<{type(v).__name__}>"
             return result
         
@@ -243,7 +243,6 @@ class ToolCall(BaseModel):
         
         # Calculate end_time from start_time + latency if not provided
         if "end_time" not in values and "start_time" in values and "latency_ms" in values:
-            from datetime import timedelta
             start = values["start_time"]
             if isinstance(start, datetime) and values["latency_ms"]:
                 values["end_time"] = start + timedelta(milliseconds=values["latency_ms"])
@@ -262,11 +261,11 @@ class ToolCall(BaseModel):
             values["cache_key"] = cls.generate_cache_key(tool_name, input_data)
         
         # Generate hashes
-        if "input_hash" not in values and values.get("input"):
+        if "input_hash" not in values and values.get("input") is not None:
             input_str = json.dumps(values["input"], sort_keys=True)
             values["input_hash"] = hashlib.sha256(input_str.encode()).hexdigest()
         
-        if "output_hash" not in values and values.get("output"):
+        if "output_hash" not in values and values.get("output") is not None:
             output_str = json.dumps(values["output"], sort_keys=True)
             values["output_hash"] = hashlib.sha256(output_str.encode()).hexdigest()
         
@@ -385,6 +384,11 @@ class KurralArtifact(BaseModel):
         indent = 2 if pretty else None
         return self.model_dump_json(indent=indent, exclude_none=True)
 
+    def to_json_bytes(self, pretty: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes without a str round-trip"""
+        indent = 2 if pretty else None
+        return self.__pydantic_serializer__.to_json(self, indent=indent, exclude_none=True)
+
     def save(self, filepath: Union[str, Path]) -> None:
         """Save artifact to .kurral file"""
         import tempfile
@@ -396,13 +400,13 @@ class KurralArtifact(BaseModel):
         # Write to temp file first, then atomically move to final location
         # This prevents leaving empty files if serialization fails
         try:
-            json_content = self.to_json(pretty=True)
+            json_content = self.to_json_bytes(pretty=True)
             if not json_content or len(json_content.strip()) == 0:
                 raise ValueError("Artifact serialization produced empty JSON")
             
             # Write to temp file
             temp_path = path.with_suffix(path.suffix + '.tmp')
-            with open(temp_path, "w", encoding='utf-8') as f:
+            with open(temp_path, "wb") as f:
                 f.write(json_content)
             
             # Atomically move temp file to final location
@@ -419,10 +423,9 @@ class KurralArtifact(BaseModel):
 
     @classmethod
     def load(cls, filepath: Union[str, Path]) -> "KurralArtifact":
-        """Load artifact from .kurral file"""
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return cls.model_validate(data)
+        """Load artifact from .kurral file (parsed and validated in a single pass)"""
+        with open(filepath, "rb") as f:
+            return cls.model_validate_json(f.read())
 
     @classmethod
     def from_json(cls, json_str: str) -> "KurralArtifact":
@@ -15,7 +15,7 @@ from typing import Dict, Optional
 # Kurral version - will be populated from package
 try:
     from kurral import __version__ as KURRAL_VERSION
-except:
+except ImportError:
     KURRAL_VERSION = "0.3.1"
 
 
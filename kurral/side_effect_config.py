@@ -2,11 +2,24 @@
 Side Effect Configuration Manager
 Manages YAML-based side effect configuration for agents
 """
+import functools
+import logging
+import re
 import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional, Set
 from kurral.models.kurral import KurralArtifact
 
+logger = logging.getLogger("kurral.side_effect_config")
+
+# Keywords suggesting a tool has side effects, compiled into a single
+# case-insensitive alternation so classification is one regex scan
+SIDE_EFFECT_KEYWORDS = frozenset({"update", "send", "write"})
+_SIDE_EFFECT_KEYWORD_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(SIDE_EFFECT_KEYWORDS)),
+    re.IGNORECASE,
+)
+
 
 class SideEffectConfig:
     """Manages side effect configuration for agents"""
@@ -52,7 +65,7 @@ class SideEffectConfig:
             # (This ensures backward compatibility)
             return config
         except Exception as e:
-            print(f"Warning: Could not load side effect config from {config_path}: {e}")
+            logger.warning("Could not load side effect config from %s: %s", config_path, e)
             return {
                 "tools": {},
                 "done": False  # Default to False for safety
@@ -90,13 +103,15 @@ class SideEffectConfig:
                 yaml.dump(config_to_save, f, default_flow_style=False, sort_keys=False)
             print(f"Side effect config saved to: {config_path}")
         except Exception as e:
-            print(f"Error: Could not save side effect config to {config_path}: {e}")
+            logger.error("Could not save side effect config to %s: %s", config_path, e)
             raise
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _has_side_effect_keywords(text: str) -> bool:
         """
-        Check if text contains side effect keywords (case-insensitive).
+        Check if text contains any of SIDE_EFFECT_KEYWORDS (case-insensitive).
+        Results are memoized since the same tool names recur across runs.
         
         Args:
             text: Text to check (tool name, description, or docstring)
@@ -107,14 +122,7 @@ class SideEffectConfig:
         if not text:
             return False
         
-        text_lower = text.lower()
-        keywords = ["update", "send", "write"]
-        
-        for keyword in keywords:
-            if keyword in text_lower:
-                return True
-        
-        return False
+        return _SIDE_EFFECT_KEYWORD_PATTERN.search(text) is not None
     
     @staticmethod
     def _get_tool_docstring(tool: Any) -> str:
@@ -142,8 +150,8 @@ class SideEffectConfig:
     def generate_config(artifact: KurralArtifact, agent_module: Any) -> Dict[str, Any]:
         """
         Auto-generate side effect configuration by discovering tools and analyzing them.
-        Suggests side effects based on tool names and descriptions containing keywords:
-        "update", "send", "write" (case-insensitive).
+        Suggests side effects based on tool names and descriptions containing
+        any of SIDE_EFFECT_KEYWORDS (case-insensitive).
         
         Args:
             artifact: The Kurral artifact containing tool calls
@@ -196,6 +204,10 @@ class SideEffectConfig:
                         elif isinstance(tool, str):
                             tool_name = tool
                         
+                        # Already flagged from its name in the artifact pass - skip rescanning
+                        if tool_name in tool_info and not tool_info[tool_name]["suggested_value"]:
+                            continue
+                        
                         if tool_name:
                             # Analyze for side effect keywords
                             combined_text = f"{tool_name} {description} {docstring}".strip()
@@ -212,7 +224,7 @@ class SideEffectConfig:
                                         "reason": "No side effect keywords found"
                                     }
         except Exception as e:
-            print(f"Warning: Could not extract tools from agent module: {e}")
+            logger.warning("Could not extract tools from agent module: %s", e)
         
         # Create config with suggested values
         tools_config = {}
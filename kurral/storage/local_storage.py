@@ -3,6 +3,8 @@ Local file system storage backend
 """
 
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -11,6 +13,10 @@ from uuid import UUID
 from kurral.models.kurral import KurralArtifact
 from kurral.storage.storage_backend import StorageBackend, StorageResult
 
+# Serializes index.json read-modify-write cycles: the background writer and
+# synchronous saves (e.g. for failed runs) can update the same index at once
+_index_lock = threading.Lock()
+
 
 class LocalStorage(StorageBackend):
     """Local file system storage backend"""
@@ -27,29 +33,48 @@ class LocalStorage(StorageBackend):
     
     def save(self, artifact: KurralArtifact) -> StorageResult:
         """Save artifact to local file system"""
+        return self.save_many([artifact])[0]
+    
+    def save_many(self, artifacts: list[KurralArtifact]) -> list[StorageResult]:
+        """Save many artifacts, rewriting index.json once for the whole batch"""
+        results = [self._write(artifact) for artifact in artifacts]
+        saved = [artifact for artifact, result in zip(artifacts, results) if result.success]
+        if saved:
+            try:
+                self._update_index_many(saved)
+            except Exception as e:
+                results = [
+                    StorageResult(success=False, error=f"Failed to save artifact {artifact.kurral_id}: {e}")
+                    if result.success else result
+                    for artifact, result in zip(artifacts, results)
+                ]
+        return results
+    
+    def _write(self, artifact: KurralArtifact) -> StorageResult:
+        """Write the artifact file (without touching the index)"""
         filename = f"{artifact.kurral_id}.kurral"
         filepath = self.storage_path / filename
         
         try:
             artifact.save(filepath)
             
-            # Verify file was written successfully
-            if not filepath.exists() or filepath.stat().st_size == 0:
+            # Verify file was written successfully (the size is reported back
+            # so metadata doesn't have to re-serialize the artifact to measure it)
+            size_bytes = filepath.stat().st_size if filepath.exists() else 0
+            if size_bytes == 0:
                 return StorageResult(
                     success=False,
                     error=f"Artifact file was not written or is empty: {filepath}"
                 )
             
-            # Update index
-            self._update_index(artifact)
-            
             # Create file URI
             storage_uri = f"file://{filepath.absolute()}"
             
             return StorageResult(
                 success=True,
                 storage_uri=storage_uri,
-                local_path=filepath
+                local_path=filepath,
+                size_bytes=size_bytes,
             )
         except Exception as e:
             # Clean up empty file if it exists
@@ -100,8 +125,23 @@ class LocalStorage(StorageBackend):
     def list_artifacts(self, limit: Optional[int] = None) -> list[KurralArtifact]:
         """List all artifacts"""
         artifacts = []
+        artifact_files = list(self.storage_path.glob("*.kurral"))
         
-        for filepath in self.storage_path.glob("*.kurral"):
+        # With a limit, use the index to pick the most recent entries so only
+        # those files are parsed (the index must cover every artifact file)
+        if limit:
+            entries = self._load_index().get("artifacts", [])
+            if len(entries) == len(artifact_files):
+                entries.sort(key=lambda e: e.get("created_at") or "", reverse=True)
+                try:
+                    return [
+                        KurralArtifact.load(self.storage_path / f"{entry['kurral_id']}.kurral")
+                        for entry in entries[:limit]
+                    ]
+                except Exception:
+                    pass  # Stale or corrupted entry: fall back to the full scan
+        
+        for filepath in artifact_files:
             try:
                 artifact = KurralArtifact.load(filepath)
                 artifacts.append(artifact)
@@ -121,34 +161,49 @@ class LocalStorage(StorageBackend):
     
     def _update_index(self, artifact: KurralArtifact) -> None:
         """Update metadata index"""
+        self._update_index_many([artifact])
+    
+    def _update_index_many(self, new_artifacts: list[KurralArtifact]) -> None:
+        """Add or update index entries for several artifacts in one rewrite"""
+        with _index_lock:
+            self._rewrite_index(new_artifacts)
+    
+    def _rewrite_index(self, new_artifacts: list[KurralArtifact]) -> None:
+        """Merge entries into index.json; callers hold _index_lock"""
         index_path = self.storage_path / "index.json"
         
         # Load existing index
         index = self._load_index()
         
-        # Add or update entry
-        entry = {
-            "kurral_id": str(artifact.kurral_id),
-            "run_id": artifact.run_id,
-            "created_at": artifact.created_at.isoformat(),
-            "tenant_id": artifact.tenant_id,
-            "semantic_buckets": artifact.semantic_buckets,
+        # Add or update entries
+        entries = {
+            str(artifact.kurral_id): {
+                "kurral_id": str(artifact.kurral_id),
+                "run_id": artifact.run_id,
+                "created_at": artifact.created_at.isoformat(),
+                "tenant_id": artifact.tenant_id,
+                "semantic_buckets": artifact.semantic_buckets,
+            }
+            for artifact in new_artifacts
         }
         
-        # Remove existing entry if present
+        # Remove existing entries if present
         artifacts = index.get("artifacts", [])
-        artifacts = [a for a in artifacts if a.get("kurral_id") != str(artifact.kurral_id)]
+        artifacts = [a for a in artifacts if a.get("kurral_id") not in entries]
         
-        # Add new entry
-        artifacts.append(entry)
+        # Add new entries
+        artifacts.extend(entries.values())
         
         # Update index
         index["artifacts"] = artifacts
         index["updated_at"] = datetime.utcnow().isoformat()
         
-        # Save index
-        with open(index_path, "w") as f:
+        # Save index to a temporary file and swap it in, so readers never
+        # see a partially written index
+        tmp_path = index_path.with_name(f"index.json.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
             json.dump(index, f, indent=2)
+        os.replace(tmp_path, index_path)
     
     def _load_index(self) -> dict:
         """Load metadata index"""
@@ -2,26 +2,97 @@
 Cloudflare R2 storage backend
 """
 
+import functools
+import gzip
+import importlib.util
+import io
 import json
-from datetime import datetime
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 from uuid import UUID
 
-try:
-    import boto3
-    from botocore.exceptions import ClientError
-    BOTO3_AVAILABLE = True
-except ImportError:
-    BOTO3_AVAILABLE = False
-
-from kurral.models.kurral import KurralArtifact
+from kurral.models.kurral import KurralArtifact, ReplayLevel
 from kurral.storage.storage_backend import StorageBackend, StorageResult
 
+# boto3/botocore are imported on first use: they add hundreds of milliseconds
+# to every import of kurral.storage, even when only local storage is used
+BOTO3_AVAILABLE = importlib.util.find_spec("boto3") is not None
+
+# r2://{bucket}/{key}, as returned in StorageResult.storage_uri
+_R2_URI_PATTERN = re.compile(r"^r2://([^/]+)/(.+)$")
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalize a datetime to aware UTC; naive values (datetime.utcnow()) are taken as UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Whether an S3 client error means the object doesn't exist"""
+    response = getattr(error, "response", None) or {}
+    return response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+
+def _client_errors() -> tuple:
+    """botocore's exception types, or () when botocore isn't installed (injected clients)"""
+    try:
+        from botocore.exceptions import BotoCoreError, ClientError
+    except ImportError:
+        return ()
+    return (BotoCoreError, ClientError)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_s3_client(endpoint_url: str, access_key_id: str, secret_access_key: str):
+    """
+    Get a shared S3 client for an R2 endpoint and credentials
+    
+    Building a client loads credentials and service models from disk, so
+    clients (which are thread-safe) are reused across R2Storage instances.
+    """
+    import boto3
+    from botocore.config import Config
+    
+    # Keep pooled connections alive (and allow more of them) so repeated
+    # operations reuse the TLS session instead of reconnecting each time
+    client_config = Config(
+        tcp_keepalive=True,
+        max_pool_connections=64,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        connect_timeout=3,
+        read_timeout=30,
+    )
+    
+    return boto3.session.Session().client(
+        "s3",
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        region_name="auto",
+        config=client_config,
+    )
+
 
 class R2Storage(StorageBackend):
     """Cloudflare R2 storage backend using S3-compatible API"""
     
+    # Artifacts at least this large are uploaded as parallel multipart chunks
+    MULTIPART_THRESHOLD = 8 * 1024 * 1024
+    # Concurrent GETs when loading many artifacts (within max_pool_connections)
+    LOAD_WORKERS = 32
+    # kurral_id -> key lookups remembered to skip listing the bucket
+    KEY_CACHE_SIZE = 1024
+    # Artifacts larger than this are gzip-compressed when compression is on
+    COMPRESS_THRESHOLD = 4096
+    # DeleteObjects accepts at most this many keys per request
+    DELETE_BATCH_SIZE = 1000
+    
     def __init__(
         self,
         account_id: str,
@@ -31,7 +102,9 @@ class R2Storage(StorageBackend):
         tenant_id: str = "default",
         agent_name: Optional[str] = None,
         path_prefix: str = "artifacts",
-        local_backup_path: Optional[Path] = None
+        local_backup_path: Optional[Path] = None,
+        compress: bool = True,
+        client: Optional[Any] = None,
     ):
         """
         Initialize R2 storage
@@ -45,8 +118,11 @@ class R2Storage(StorageBackend):
             agent_name: Agent name for organizing artifacts (e.g., "level3agentK")
             path_prefix: Path prefix for artifact type ("artifacts" or "replay_runs")
             local_backup_path: Optional local path for backup storage (not used in R2-only mode)
+            compress: Gzip artifacts above COMPRESS_THRESHOLD bytes (stored with Content-Encoding: gzip)
+            client: Optional pre-built S3 client (e.g. kurral.storage.testing.NullS3Client);
+                boto3 is not needed when one is given
         """
-        if not BOTO3_AVAILABLE:
+        if client is None and not BOTO3_AVAILABLE:
             raise ImportError(
                 "boto3 is required for R2 storage. Install it with: pip install boto3"
             )
@@ -57,17 +133,37 @@ class R2Storage(StorageBackend):
         self.agent_name = agent_name
         self.path_prefix = path_prefix
         self.local_backup_path = local_backup_path
+        self.compress = compress
+        self._uri_prefix = f"r2://{bucket_name}/"
+        
+        self._key_cache: OrderedDict[UUID, str] = OrderedDict()
+        
+        # Every key starts with the same tenant/agent/path_prefix segments
+        if agent_name:
+            self._key_prefix = f"{tenant_id}/{agent_name}/{path_prefix}/"
+        else:
+            self._key_prefix = f"{tenant_id}/{path_prefix}/"
         
         # Initialize S3 client for R2
-        endpoint_url = f"https://{account_id}.r2.cloudflarestorage.com"
-        
-        self.s3_client = boto3.client(
-            "s3",
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            region_name="auto",
-        )
+        if client is not None:
+            self.s3_client = client
+        else:
+            endpoint_url = f"https://{account_id}.r2.cloudflarestorage.com"
+            self.s3_client = _get_s3_client(endpoint_url, access_key_id, secret_access_key)
+        self._transfer_config = None
+    
+    def _get_transfer_config(self):
+        """TransferConfig for multipart uploads, built on first use"""
+        if self._transfer_config is None:
+            from boto3.s3.transfer import TransferConfig
+            
+            self._transfer_config = TransferConfig(
+                multipart_threshold=self.MULTIPART_THRESHOLD,
+                multipart_chunksize=50 * 1024 * 1024,
+                max_concurrency=8,
+                use_threads=True,
+            )
+        return self._transfer_config
     
     def _get_key(self, kurral_id: UUID, created_at: datetime) -> str:
         """
@@ -76,31 +172,17 @@ class R2Storage(StorageBackend):
         Format: {tenant_id}/{agent_name}/{path_prefix}/{year}/{month}/{kurral_id}.kurral
         If agent_name is None, uses: {tenant_id}/{path_prefix}/{year}/{month}/{kurral_id}.kurral
         """
-        parts = [self.tenant_id]
-        
-        # Add agent name if provided
-        if self.agent_name:
-            parts.append(self.agent_name)
-        
-        # Add path prefix (artifacts or replay_runs)
-        parts.append(self.path_prefix)
-        
-        # Add date-based organization
-        parts.extend([
-            str(created_at.year),
-            f"{created_at.month:02d}",
-            f"{kurral_id}.kurral"
-        ])
-        
-        return "/".join(parts)
+        return f"{self._key_prefix}{created_at.year}/{created_at.month:02d}/{kurral_id}.kurral"
     
     def save(self, artifact: KurralArtifact) -> StorageResult:
         """Save artifact to R2"""
-        key = self._get_key(artifact.kurral_id, artifact.created_at)
+        # Re-saving an artifact (artifacts are immutable, so its key can't
+        # change) reuses the cached key instead of formatting it again
+        key = self._key_cache.get(artifact.kurral_id) or self._get_key(artifact.kurral_id, artifact.created_at)
         
         try:
-            # Serialize artifact
-            content = artifact.to_json(pretty=True)
+            # Serialize artifact once; the encoded body is reused for the size
+            body = artifact.to_json_bytes(pretty=True)
             
             # Metadata
             metadata = {
@@ -108,24 +190,45 @@ class R2Storage(StorageBackend):
                 "tenant-id": artifact.tenant_id,
                 "created-at": artifact.created_at.isoformat(),
             }
+            extra_args = {
+                "ContentType": "application/json",
+                "Metadata": metadata,
+            }
             
-            # Upload to R2
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=content.encode("utf-8"),
-                ContentType="application/json",
-                Metadata=metadata,
-            )
+            # Artifact JSON compresses well; level 1 keeps the CPU cost low
+            if self.compress and len(body) > self.COMPRESS_THRESHOLD:
+                body = gzip.compress(body, compresslevel=1)
+                extra_args["ContentEncoding"] = "gzip"
+            
+            # Upload to R2: a single PUT for typical artifacts, multipart
+            # (retried per part) once the body is large enough to benefit
+            if len(body) >= self.MULTIPART_THRESHOLD:
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(body),
+                    self.bucket_name,
+                    key,
+                    ExtraArgs=extra_args,
+                    Config=self._get_transfer_config(),
+                )
+            else:
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=body,
+                    **extra_args,
+                )
+            
+            self._remember_key(artifact.kurral_id, key)
             
             # Create R2 URI
-            storage_uri = f"r2://{self.bucket_name}/{key}"
+            storage_uri = self._uri_prefix + key
             
             # R2-only mode: no local backup
             return StorageResult(
                 success=True,
                 storage_uri=storage_uri,
-                local_path=None  # R2-only, no local backup
+                local_path=None,  # R2-only, no local backup
+                size_bytes=len(body),
             )
         except Exception as e:
             return StorageResult(
@@ -133,48 +236,160 @@ class R2Storage(StorageBackend):
                 error=f"Failed to upload artifact to R2: {e}"
             )
     
+    def _search_prefix(self) -> str:
+        """Prefix covering every artifact for this tenant/agent/path_prefix"""
+        return self._key_prefix
+    
+    def _iter_keys(self, prefix: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield artifact keys under the search prefix (or a narrower prefix)
+        
+        Listing pages are fetched lazily, so callers that stop early never
+        request the remaining pages and memory stays bounded to one page.
+        """
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix or self._search_prefix())
+        
+        for page in pages:
+            for obj in page.get("Contents", []):
+                key = obj["Key"]
+                if key.endswith(".kurral"):
+                    yield key
+    
+    def _month_prefixes(self, start_date: datetime, end_date: datetime) -> list[str]:
+        """Key prefixes for every year/month segment between two dates (inclusive)"""
+        prefixes = []
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            prefixes.append(f"{self._search_prefix()}{year}/{month:02d}/")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return prefixes
+    
+    def _list_keys_between(self, start_date: datetime, end_date: datetime) -> list[str]:
+        """List artifact keys in a date range, one concurrent listing per month"""
+        prefixes = self._month_prefixes(start_date, end_date)
+        if not prefixes:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(self.LOAD_WORKERS, len(prefixes))) as executor:
+            listings = executor.map(lambda prefix: list(self._iter_keys(prefix)), prefixes)
+            return [key for keys in listings for key in keys]
+    
+    def _newest_month_keys(self, keys: list[str], limit: int) -> list[str]:
+        """
+        Keep only the keys from the newest year/month segments needed to cover limit
+        
+        Whole months are kept so ordering within a month is still decided by
+        created_at after loading; older months are never downloaded.
+        """
+        month_start = len(self._key_prefix)
+        by_month: dict[str, list[str]] = {}
+        for key in keys:
+            by_month.setdefault(key[month_start:month_start + 7], []).append(key)
+        
+        selected: list[str] = []
+        for month in sorted(by_month, reverse=True):
+            if len(selected) >= limit:
+                break
+            selected.extend(by_month[month])
+        return selected
+    
+    def _get_object_body(self, key: str) -> bytes:
+        """Download the body of a single artifact object, decompressing if needed"""
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        body = response["Body"].read()
+        if response.get("ContentEncoding") == "gzip":
+            return gzip.decompress(body)
+        return body
+    
+    def _get_artifact_data(self, key: str) -> dict:
+        """Download and parse a single artifact object"""
+        # json.loads accepts UTF-8 bytes directly; no intermediate str
+        return json.loads(self._get_object_body(key))
+    
     def load(self, kurral_id: UUID) -> Optional[KurralArtifact]:
         """
         Load artifact by ID from R2
         
         Searches through all artifacts in the agent's path prefix to find by kurral_id
         """
-        # Build search prefix
-        if self.agent_name:
-            prefix = f"{self.tenant_id}/{self.agent_name}/{self.path_prefix}/"
-        else:
-            prefix = f"{self.tenant_id}/{self.path_prefix}/"
-        
-        # Search through all artifacts in the prefix
         try:
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+            key = self._find_key(kurral_id)
+            if key is None:
+                return None
             
-            for page in pages:
-                for obj in page.get("Contents", []):
-                    key = obj["Key"]
-                    if not key.endswith(".kurral"):
-                        continue
-                    
-                    # Quick check: if filename matches kurral_id, try loading it
-                    if str(kurral_id) not in key:
-                        continue
-                    
-                    try:
-                        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-                        content = response["Body"].read().decode("utf-8")
-                        artifact_data = json.loads(content)
-                        
-                        # Verify it's the right artifact
-                        if UUID(artifact_data["kurral_id"]) == kurral_id:
-                            return KurralArtifact(**artifact_data)
-                    except Exception:
-                        continue
+            # Validate straight from the downloaded bytes in one pass
+            artifact = KurralArtifact.model_validate_json(self._get_object_body(key))
+            
+            # Verify it's the right artifact
+            if artifact.kurral_id == kurral_id:
+                return artifact
         except Exception:
             pass
         
         return None
     
+    def _find_key(self, kurral_id: UUID) -> Optional[str]:
+        """
+        Find the object key for an artifact
+        
+        Artifacts are immutable once written, so a key found (or saved) once
+        is remembered and later lookups skip listing the bucket.
+        """
+        key = self._key_cache.get(kurral_id)
+        if key is not None:
+            self._key_cache.move_to_end(kurral_id)
+            return key
+        
+        filename = f"/{kurral_id}.kurral"
+        for key in self._iter_keys():
+            if key.endswith(filename):
+                self._remember_key(kurral_id, key)
+                return key
+        return None
+    
+    def _remember_key(self, kurral_id: UUID, key: str) -> None:
+        """Cache a kurral_id -> key mapping, dropping the least recently used"""
+        self._key_cache[kurral_id] = key
+        self._key_cache.move_to_end(kurral_id)
+        if len(self._key_cache) > self.KEY_CACHE_SIZE:
+            self._key_cache.popitem(last=False)
+    
+    def load_by_uri(self, uri: str) -> Optional[KurralArtifact]:
+        """
+        Load artifact directly from its r2:// storage URI
+        
+        The key is taken from the URI, so no bucket listing is needed; useful
+        with the object_storage_uri recorded in artifact metadata.
+        """
+        match = _R2_URI_PATTERN.match(uri)
+        if match is None or match.group(1) != self.bucket_name:
+            return None
+        
+        try:
+            return KurralArtifact.model_validate_json(self._get_object_body(match.group(2)))
+        except Exception:
+            return None
+    
+    def load_many(self, keys: list[str]) -> list[KurralArtifact]:
+        """
+        Load artifacts for many keys, fetching them concurrently
+        
+        Objects that fail to download or parse are skipped; the rest are
+        returned in the order of keys.
+        """
+        def load_key(key: str) -> Optional[KurralArtifact]:
+            try:
+                return KurralArtifact.model_validate_json(self._get_object_body(key))
+            except Exception:
+                return None
+        
+        if not keys:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(self.LOAD_WORKERS, len(keys))) as executor:
+            return [artifact for artifact in executor.map(load_key, keys) if artifact is not None]
+    
     def load_by_run_id(self, run_id: str) -> Optional[KurralArtifact]:
         """
         Load artifact by run_id from R2
@@ -182,80 +397,157 @@ class R2Storage(StorageBackend):
         Note: This requires listing objects, which can be slow.
         Consider using metadata indexing for better performance.
         """
-        # List objects in tenant/agent/path_prefix folder
-        if self.agent_name:
-            prefix = f"{self.tenant_id}/{self.agent_name}/{self.path_prefix}/"
-        else:
-            prefix = f"{self.tenant_id}/{self.path_prefix}/"
-        
         try:
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
-            
-            for page in pages:
-                for obj in page.get("Contents", []):
-                    key = obj["Key"]
-                    if not key.endswith(".kurral"):
-                        continue
+            for key in self._iter_keys():
+                try:
+                    artifact_data = self._get_artifact_data(key)
                     
-                    try:
-                        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-                        content = response["Body"].read().decode("utf-8")
-                        artifact_data = json.loads(content)
-                        
-                        if artifact_data.get("run_id") == run_id:
-                            return KurralArtifact(**artifact_data)
-                    except Exception:
-                        continue
+                    if artifact_data.get("run_id") == run_id:
+                        return KurralArtifact(**artifact_data)
+                except Exception:
+                    continue
         except Exception:
             pass
         
         return None
     
     def exists(self, kurral_id: UUID) -> bool:
-        """Check if artifact exists in R2"""
-        return self.load(kurral_id) is not None
+        """Check if artifact exists in R2 (by key, without downloading it)"""
+        try:
+            key = self._key_cache.get(kurral_id)
+            if key is None:
+                return self._find_key(kurral_id) is not None
+            # The object may have been deleted elsewhere since its key was cached
+            return self._cached_key_exists(kurral_id, key)
+        except Exception:
+            return False
     
-    def list_artifacts(self, limit: Optional[int] = None) -> list[KurralArtifact]:
+    def _cached_key_exists(self, kurral_id: UUID, key: str) -> bool:
+        """HEAD a cached key, forgetting it if the object is gone"""
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except Exception as e:
+            if not _is_not_found(e):
+                raise
+            self._key_cache.pop(kurral_id, None)
+            return False
+        return True
+    
+    def delete(self, kurral_id: UUID) -> bool:
+        """Delete an artifact from R2, returning whether it was found and deleted"""
+        return self.delete_many([kurral_id]) == 1
+    
+    def delete_many(self, kurral_ids: Iterable[UUID]) -> int:
+        """
+        Delete many artifacts from R2
+        
+        Keys are resolved with at most one bucket listing and removed with
+        DeleteObjects, up to 1000 keys per request, with batches sent
+        concurrently. Cached keys are confirmed with HEAD first, since quiet
+        DeleteObjects reports missing keys as deleted.
+        
+        Returns:
+            Number of artifacts deleted
+        """
+        wanted = set(kurral_ids)
+        cached = {kurral_id: self._key_cache[kurral_id] for kurral_id in wanted if kurral_id in self._key_cache}
+        keys = {}
+        if cached:
+            with ThreadPoolExecutor(max_workers=min(self.LOAD_WORKERS, len(cached))) as executor:
+                found = executor.map(lambda item: self._cached_key_exists(*item), cached.items())
+                keys = {kurral_id: key for (kurral_id, key), exists in zip(cached.items(), found) if exists}
+        
+        # Cached keys that turned out to be gone need no listing: the key for
+        # an artifact never changes, so a listing wouldn't find them either
+        missing = wanted - cached.keys()
+        if missing:
+            by_filename = {f"{kurral_id}.kurral": kurral_id for kurral_id in missing}
+            for key in self._iter_keys():
+                kurral_id = by_filename.get(key.rsplit("/", 1)[-1])
+                if kurral_id is not None:
+                    keys[kurral_id] = key
+        
+        key_list = list(keys.values())
+        batches = [
+            key_list[i:i + self.DELETE_BATCH_SIZE]
+            for i in range(0, len(key_list), self.DELETE_BATCH_SIZE)
+        ]
+        if not batches:
+            return 0
+        
+        def delete_batch(batch: list[str]) -> int:
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            # Quiet mode only reports failures
+            return len(batch) - len(response.get("Errors", []))
+        
+        with ThreadPoolExecutor(max_workers=min(self.LOAD_WORKERS, len(batches))) as executor:
+            deleted = sum(executor.map(delete_batch, batches))
+        
+        for kurral_id in keys:
+            self._key_cache.pop(kurral_id, None)
+        
+        return deleted
+    
+    def list_artifacts(
+        self,
+        limit: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        replay_level: Optional[ReplayLevel] = None,
+        deterministic: Optional[bool] = None,
+    ) -> list[KurralArtifact]:
         """
         List all artifacts from R2
         
+        Either date bound may be given on its own. With start_date, only the
+        year/month key prefixes from it onwards are listed (concurrently);
+        with end_date, later months are skipped before downloading. Naive
+        datetimes are taken as UTC.
+        
+        replay_level/deterministic filters are checked on the loaded artifacts.
+        
         Note: This can be slow for large buckets.
         Consider using metadata indexing for better performance.
         """
-        artifacts = []
-        # List objects in tenant/agent/path_prefix folder
-        if self.agent_name:
-            prefix = f"{self.tenant_id}/{self.agent_name}/{self.path_prefix}/"
-        else:
-            prefix = f"{self.tenant_id}/{self.path_prefix}/"
+        start = _as_utc(start_date) if start_date else None
+        end = _as_utc(end_date) if end_date else None
+        filtered = replay_level is not None or deterministic is not None
+        
+        def keep(artifact: KurralArtifact) -> bool:
+            created_at = _as_utc(artifact.created_at)
+            if start and created_at < start:
+                return False
+            if end and created_at > end:
+                return False
+            if replay_level is not None and artifact.replay_level != replay_level:
+                return False
+            if deterministic is not None and artifact.deterministic != deterministic:
+                return False
+            return True
         
         try:
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
-            
-            for page in pages:
-                for obj in page.get("Contents", []):
-                    key = obj["Key"]
-                    if not key.endswith(".kurral"):
-                        continue
-                    
-                    try:
-                        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-                        content = response["Body"].read().decode("utf-8")
-                        artifact_data = json.loads(content)
-                        artifact = KurralArtifact(**artifact_data)
-                        artifacts.append(artifact)
-                    except Exception:
-                        continue
-        except Exception:
-            pass
+            if start:
+                keys = self._list_keys_between(start, end or max(start, datetime.now(timezone.utc)))
+            else:
+                keys = list(self._iter_keys())
+                if end:
+                    month_start = len(self._key_prefix)
+                    last_month = f"{end.year}/{end.month:02d}"
+                    keys = [key for key in keys if key[month_start:month_start + 7] <= last_month]
+            # With filters or a date bound, the newest months may not hold limit matches
+            if limit and not filtered and not (start or end):
+                keys = self._newest_month_keys(keys, limit)
+        except _client_errors():
+            keys = []
+        artifacts = [artifact for artifact in self.load_many(keys) if keep(artifact)]
         
         # Sort by created_at, most recent first
-        artifacts.sort(key=lambda x: x.created_at, reverse=True)
+        artifacts.sort(key=lambda x: _as_utc(x.created_at), reverse=True)
         
         if limit:
             artifacts = artifacts[:limit]
         
         return artifacts
-
@@ -20,6 +20,7 @@ class StorageResult:
     storage_uri: Optional[str] = None  # URI like "r2://bucket/key" or "file://path"
     local_path: Optional[Path] = None  # Local file path if applicable
     error: Optional[str] = None
+    size_bytes: Optional[int] = None  # Serialized payload size, when known
 
 
 class StorageBackend(ABC):
@@ -38,6 +39,18 @@ class StorageBackend(ABC):
         """
         pass
     
+    def save_many(self, artifacts: list[KurralArtifact]) -> list[StorageResult]:
+        """
+        Save many artifacts
+        
+        Backends override this when a batch can share work (e.g. one index
+        update); the default saves each artifact in turn.
+        
+        Returns:
+            StorageResult per artifact, in order
+        """
+        return [self.save(artifact) for artifact in artifacts]
+    
     @abstractmethod
     def load(self, kurral_id: UUID) -> Optional[KurralArtifact]:
         """
@@ -0,0 +1,104 @@
+"""
+In-memory S3 client for exercising R2Storage without boto3 or network access
+"""
+
+import io
+from typing import Any, Iterator, Optional
+
+
+class NoSuchKeyError(KeyError):
+    """Missing-object error carrying the same response shape as botocore's ClientError"""
+
+    def __init__(self, key: str):
+        super().__init__(f"NoSuchKey: {key}")
+        self.response = {"Error": {"Code": "NoSuchKey", "Message": "The specified key does not exist."}}
+
+
+class NullS3Client:
+    """
+    Dict-backed stand-in for a boto3 S3 client
+
+    Implements only the calls R2Storage makes. Pass it as
+    R2Storage(..., client=NullS3Client()) so boto3 is never imported.
+    """
+
+    def __init__(self):
+        # (bucket, key) -> {"Body": bytes, "ContentEncoding": str|None, ...}
+        self.objects: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def _not_found(self, key: str) -> KeyError:
+        return NoSuchKeyError(key)
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs) -> dict:
+        """Store an object"""
+        if isinstance(Body, str):
+            Body = Body.encode("utf-8")
+        self.objects[(Bucket, Key)] = {"Body": bytes(Body), **kwargs}
+        return {}
+
+    def upload_fileobj(self, Fileobj, Bucket: str, Key: str, ExtraArgs: Optional[dict] = None, Config=None) -> None:
+        """Store an object read from a file-like object (multipart uploads)"""
+        self.put_object(Bucket=Bucket, Key=Key, Body=Fileobj.read(), **(ExtraArgs or {}))
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        """Return an object with a file-like Body"""
+        try:
+            stored = self.objects[(Bucket, Key)]
+        except KeyError:
+            raise self._not_found(Key) from None
+        response = {k: v for k, v in stored.items() if k != "Body"}
+        response["Body"] = io.BytesIO(stored["Body"])
+        response["ContentLength"] = len(stored["Body"])
+        return response
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        """Return object metadata without the body"""
+        response = self.get_object(Bucket=Bucket, Key=Key)
+        response.pop("Body")
+        return response
+
+    def delete_object(self, Bucket: str, Key: str) -> dict:
+        """Delete an object (a missing key is not an error, as in S3)"""
+        self.objects.pop((Bucket, Key), None)
+        return {}
+
+    def delete_objects(self, Bucket: str, Delete: dict) -> dict:
+        """Delete many objects"""
+        deleted = []
+        for obj in Delete["Objects"]:
+            self.delete_object(Bucket=Bucket, Key=obj["Key"])
+            deleted.append({"Key": obj["Key"]})
+        return {} if Delete.get("Quiet") else {"Deleted": deleted}
+
+    def get_paginator(self, operation_name: str) -> "_ListObjectsPaginator":
+        """Return a paginator (only list_objects_v2 is supported)"""
+        if operation_name != "list_objects_v2":
+            raise NotImplementedError(f"Unsupported paginator: {operation_name}")
+        return _ListObjectsPaginator(self)
+
+
+class _ListObjectsPaginator:
+    """Paginator over NullS3Client keys, in key order like S3"""
+
+    PAGE_SIZE = 1000
+
+    def __init__(self, client: NullS3Client):
+        self.client = client
+
+    def paginate(self, Bucket: str, Prefix: str = "") -> Iterator[dict]:
+        keys = sorted(
+            key for bucket, key in self.client.objects
+            if bucket == Bucket and key.startswith(Prefix)
+        )
+        if not keys:
+            yield {"KeyCount": 0}
+            return
+        for i in range(0, len(keys), self.PAGE_SIZE):
+            page = keys[i:i + self.PAGE_SIZE]
+            yield {
+                "Contents": [
+                    {"Key": key, "Size": len(self.client.objects[(Bucket, key)]["Body"])}
+                    for key in page
+                ],
+                "KeyCount": len(page),
+            }
@@ -0,0 +1,30 @@
+"""
+Unit tests for the MCP proxy's upstream client lifecycle
+"""
+
+import pytest
+from kurral.mcp.config import MCPConfig
+from kurral.mcp.models import JSONRPCRequest
+from kurral.mcp.proxy import FASTAPI_AVAILABLE, KurralMCPProxy
+
+httpx = pytest.importorskip("httpx")
+pytestmark = pytest.mark.skipif(not FASTAPI_AVAILABLE, reason="requires kurral[mcp]")
+
+
+def upstream(request):
+    """Mock upstream MCP server answering every call."""
+    return httpx.Response(200, json={"jsonrpc": "2.0", "id": "1", "result": {"ok": True}})
+
+
+async def test_lifespan_can_run_twice():
+    """Test that requests are forwarded after the app has been shut down and started again."""
+    config = MCPConfig(servers={"test": {"url": "http://upstream.test/mcp"}})
+    proxy = KurralMCPProxy(config)
+    proxy._new_http_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+    request = JSONRPCRequest(id="1", method="tools/call", params={"name": "echo", "arguments": {}})
+
+    for _ in range(2):
+        async with proxy.app.router.lifespan_context(proxy.app):
+            response = await proxy._handle_record(request)
+            assert b'"ok": true' in response.body
+        assert proxy._http_client.is_closed
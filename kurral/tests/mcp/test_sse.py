@@ -112,6 +112,45 @@ class TestSSECapture:
         assert captured.events[1].data["percent"] == 25
         assert captured.events[-1].event_type == "complete"
 
+    def test_capture_events_bulk(self):
+        """Test capturing several SSE events in one call."""
+        config = MCPConfig()
+        engine = MCPCaptureEngine(config)
+
+        request = JSONRPCRequest(
+            id="123",
+            method="tools/call",
+            params={"name": "stream_tool", "arguments": {}}
+        )
+        tracking_id = engine.capture_request(request, "test-server")
+
+        engine.capture_event(tracking_id, {"status": "started"}, "start")
+        engine.capture_events(tracking_id, [
+            ("progress", {"percent": 50}),
+            ("complete", {"result": "done"}),
+        ])
+
+        captured = engine.finalize_capture(tracking_id)
+
+        assert captured.was_sse is True
+        assert [e.event_type for e in captured.events] == ["start", "progress", "complete"]
+        assert captured.events[1].data["percent"] == 50
+        assert captured.metrics.event_count == 3
+
+    def test_capture_events_respects_event_limit(self):
+        """Test that bulk capture stops at max_events_per_call."""
+        config = MCPConfig()
+        config.capture.max_events_per_call = 2
+        engine = MCPCaptureEngine(config)
+
+        request = JSONRPCRequest(id="1", method="tools/call", params={"name": "t", "arguments": {}})
+        tracking_id = engine.capture_request(request, "test")
+
+        engine.capture_events(tracking_id, (("progress", {"n": n}) for n in range(5)))
+
+        captured = engine.finalize_capture(tracking_id)
+        assert [e.data["n"] for e in captured.events] == [0, 1]
+
     def test_finalize_extracts_final_result(self):
         """Test that finalize extracts result from last event."""
         config = MCPConfig()
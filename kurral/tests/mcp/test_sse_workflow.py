@@ -1,10 +1,8 @@
-#!/usr/bin/env python3
 """
-Manual SSE test runner (doesn't require pytest)
+End-to-end SSE capture and replay tests
 """
 
-import sys
-sys.path.insert(0, '/tmp/kurralv3')
+import pytest
 
 from kurral.mcp.models import MCPEvent, CapturedMCPCall, JSONRPCRequest
 from kurral.mcp.capture import MCPCaptureEngine
@@ -13,6 +11,12 @@ from kurral.mcp.config import MCPConfig
 from datetime import datetime
 
 
+@pytest.fixture(scope="module")
+def config():
+    """One MCPConfig shared by every test (engines keep per-test state)."""
+    return MCPConfig()
+
+
 def test_mcp_event():
     """Test MCPEvent model."""
     event = MCPEvent(
@@ -22,7 +26,6 @@ def test_mcp_event():
     assert event.event_type == "progress"
     assert event.data["status"] == "processing"
     assert isinstance(event.timestamp, datetime)
-    print("✓ test_mcp_event")
 
 
 def test_captured_call_sse():
@@ -41,12 +44,10 @@ def test_captured_call_sse():
     assert call.was_sse is True
     assert len(call.events) == 2
     assert call.events[0].event_type == "start"
-    print("✓ test_captured_call_sse")
 
 
-def test_capture_events():
+def test_capture_events(config):
     """Test capturing SSE events."""
-    config = MCPConfig()
     engine = MCPCaptureEngine(config)
 
     request = JSONRPCRequest(
@@ -74,12 +75,9 @@ def test_capture_events():
     assert captured.metrics.event_count == 3
     assert captured.metrics.total_duration_ms >= 0
 
-    print("✓ test_capture_events")
 
-
-def test_replay_sse():
+def test_replay_sse(config):
     """Test replaying SSE events."""
-    config = MCPConfig()
 
     events = [
         MCPEvent(event_type="start", data={"status": "started"}),
@@ -106,12 +104,10 @@ def test_replay_sse():
     cached = engine.cached_calls[0]
     assert cached.was_sse is True
     assert len(cached.events) == 2
-    print("✓ test_replay_sse")
 
 
-def test_full_workflow():
+def test_full_workflow(config):
     """Test complete SSE workflow."""
-    config = MCPConfig()
 
     # RECORD
     capture = MCPCaptureEngine(config)
@@ -131,6 +127,11 @@ def test_full_workflow():
     )
 
     captured = capture.finalize_capture(tracking_id)
+    assert captured is not None
+    assert captured.tool_name == "analyze_image"
+    assert captured.was_sse is True
+    assert [e.event_type for e in captured.events] == ["progress", "progress", "complete"]
+
     artifact = capture.export_to_kurral()
 
     # REPLAY
@@ -147,28 +148,3 @@ def test_full_workflow():
     assert response.id == "replay-456"
     # Result is extracted from last event's "result" field
     assert response.result == {"objects": ["cat", "dog"]}
-
-    print("✓ test_full_workflow")
-
-
-if __name__ == "__main__":
-    print("Running SSE Unit Tests...\n")
-
-    try:
-        test_mcp_event()
-        test_captured_call_sse()
-        test_capture_events()
-        test_replay_sse()
-        test_full_workflow()
-
-        print("\n" + "="*50)
-        print("✅ ALL SSE TESTS PASSED! (5/5)")
-        print("="*50)
-    except AssertionError as e:
-        print(f"\n❌ Test failed: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
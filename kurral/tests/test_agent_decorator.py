@@ -0,0 +1,65 @@
+"""
+Tests for trace_agent result caching
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from kurral import agent_decorator
+from kurral.agent_decorator import trace_agent, trace_agent_invoke
+
+
+@pytest.fixture(autouse=True)
+def agent_folder(tmp_path, monkeypatch):
+    """Keep the decorator's artifacts directory inside tmp_path"""
+    monkeypatch.setattr(agent_decorator, "_get_agent_folder_path", lambda func: tmp_path)
+    return tmp_path
+
+
+class CountingExecutor:
+    """Stand-in AgentExecutor that counts invocations"""
+
+    def __init__(self):
+        self.tools = []
+        self.calls = 0
+
+    def invoke(self, input_data, config=None):
+        self.calls += 1
+        return {"input": input_data["input"], "output": f"answer {self.calls}"}
+
+
+class TestTraceAgentCache:
+    """Test suite for trace_agent(cache=True)"""
+
+    def test_repeated_input_reuses_result(self):
+        """Test that identical inputs within a session invoke the agent once"""
+        executor = CountingExecutor()
+
+        @trace_agent(auto_export=False, cache=True)
+        def main():
+            return [
+                trace_agent_invoke(executor, {"input": "hi"}, auto_export=False),
+                trace_agent_invoke(executor, {"input": "hi"}, auto_export=False),
+                trace_agent_invoke(executor, {"input": "bye"}, auto_export=False),
+            ]
+
+        results = main()
+        assert executor.calls == 2
+        assert results[0] == results[1] == {"input": "hi", "output": "answer 1"}
+        assert results[2]["output"] == "answer 2"
+
+    def test_cache_disabled_by_default(self):
+        """Test that every invoke runs the agent without cache=True"""
+        executor = CountingExecutor()
+
+        @trace_agent(auto_export=False)
+        def main():
+            for _ in range(2):
+                trace_agent_invoke(executor, {"input": "hi"}, auto_export=False)
+
+        main()
+        assert executor.calls == 2
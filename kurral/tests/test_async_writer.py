@@ -0,0 +1,145 @@
+"""
+Tests for the background artifact writer
+"""
+
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from kurral.async_writer import AsyncArtifactWriter
+
+
+class RecordingManager:
+    """Stand-in ArtifactManager that records saves"""
+
+    def __init__(self, fail: bool = False):
+        self.saved = []
+        self.threads = []
+        self.fail = fail
+
+    def save(self, artifact):
+        self.threads.append(threading.current_thread().name)
+        if self.fail:
+            raise IOError("disk full")
+        self.saved.append(artifact)
+        return Path(f"/tmp/{artifact.kurral_id}.kurral")
+
+
+class TestAsyncArtifactWriter:
+    """Test suite for AsyncArtifactWriter"""
+
+    def test_submit_saves_on_worker_thread(self):
+        """Test that submitted artifacts are saved off the caller thread"""
+        writer = AsyncArtifactWriter()
+        manager = RecordingManager()
+        artifacts = [SimpleNamespace(kurral_id=uuid4()) for _ in range(5)]
+        saved_paths = []
+
+        for artifact in artifacts:
+            writer.submit(manager, artifact, saved_paths.append)
+        writer.flush()
+
+        assert manager.saved == artifacts
+        assert len(saved_paths) == 5
+        assert set(manager.threads) == {"kurral-artifact-writer"}
+
+    def test_full_queue_blocks_until_worker_catches_up(self):
+        """Test that a full queue makes submit() wait instead of saving on the caller thread"""
+        writer = AsyncArtifactWriter(max_pending=1)
+        release = threading.Event()
+
+        class BlockingManager(RecordingManager):
+            def save(self, artifact):
+                release.wait(5)
+                return super().save(artifact)
+
+        manager = BlockingManager()
+        submitter = threading.Thread(
+            target=lambda: [writer.submit(manager, SimpleNamespace(kurral_id=uuid4())) for _ in range(3)]
+        )
+        submitter.start()
+        submitter.join(0.2)
+        assert submitter.is_alive()
+
+        release.set()
+        submitter.join(5)
+        writer.flush()
+
+        assert len(manager.saved) == 3
+        assert set(manager.threads) == {"kurral-artifact-writer"}
+
+    def test_save_errors_do_not_stop_worker(self, caplog):
+        """Test that a failed save is reported and later saves still run"""
+        writer = AsyncArtifactWriter()
+        writer.submit(RecordingManager(fail=True), SimpleNamespace(kurral_id=uuid4()))
+        manager = RecordingManager()
+        writer.submit(manager, SimpleNamespace(kurral_id=uuid4()))
+        writer.flush()
+
+        assert len(manager.saved) == 1
+        assert "Failed to save artifact" in caplog.text
+
+    def test_queued_artifacts_saved_as_batch(self):
+        """Test that artifacts queued behind a slow save go through save_many together"""
+        writer = AsyncArtifactWriter()
+        release = threading.Event()
+
+        class BatchingManager(RecordingManager):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def save(self, artifact):
+                release.wait(5)
+                return super().save(artifact)
+
+            def save_many(self, artifacts):
+                self.batches.append(len(artifacts))
+                return [Path(f"/tmp/{a.kurral_id}.kurral") for a in artifacts]
+
+        manager = BatchingManager()
+        saved_paths = []
+        for _ in range(4):
+            writer.submit(manager, SimpleNamespace(kurral_id=uuid4()), saved_paths.append)
+        release.set()
+        writer.flush()
+
+        assert len(saved_paths) == 4
+        assert sum(manager.batches) + len(manager.saved) == 4
+        assert max(manager.batches) > 1
+
+    def test_task_runs_on_worker_and_its_saves_are_flushed(self):
+        """Test that a queued task runs off the caller thread and flush waits for its saves"""
+        writer = AsyncArtifactWriter()
+        manager = RecordingManager()
+        task_threads = []
+
+        def task():
+            task_threads.append(threading.current_thread().name)
+            writer.submit(manager, SimpleNamespace(kurral_id=uuid4()))
+
+        writer.submit_task(task)
+        writer.flush()
+
+        assert task_threads == ["kurral-artifact-writer"]
+        assert len(manager.saved) == 1
+
+    def test_task_errors_do_not_stop_worker(self, caplog):
+        """Test that a failing task is reported and later work still runs"""
+        writer = AsyncArtifactWriter()
+
+        def failing_task():
+            raise ValueError("bad artifact")
+
+        writer.submit_task(failing_task)
+        manager = RecordingManager()
+        writer.submit(manager, SimpleNamespace(kurral_id=uuid4()))
+        writer.flush()
+
+        assert len(manager.saved) == 1
+        assert "Failed to generate artifact" in caplog.text
@@ -0,0 +1,171 @@
+"""
+Tests for cache backends
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from kurral.cache import ZSTD_AVAILABLE, MemoryCache, SQLiteCache
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    """Create a SQLite cache in a temporary directory"""
+    cache = SQLiteCache(db_path=tmp_path / "cache.db")
+    yield cache
+    cache.close()
+
+
+class TestSQLiteCache:
+    """Test suite for SQLiteCache"""
+
+    def test_prime_and_get(self, sqlite_cache):
+        """Test round-tripping a response through the cache"""
+        sqlite_cache.prime("sha256:abc", {"output": "hello", "n": 1})
+        assert sqlite_cache.get("sha256:abc") == {"output": "hello", "n": 1}
+        assert sqlite_cache.get("sha256:missing") is None
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_large_response_compressed(self, sqlite_cache):
+        """Test that responses above the compression threshold are stored compressed"""
+        response = {"output": "x" * 10_000}
+        sqlite_cache.prime("big", response)
+        stored = sqlite_cache.conn.execute("SELECT response FROM cache WHERE cache_key = 'big'").fetchone()[0]
+        assert len(stored) < 10_000
+        assert sqlite_cache.get("big") == response
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that entries survive reopening the database"""
+        db_path = tmp_path / "cache.db"
+        cache = SQLiteCache(db_path=db_path)
+        cache.prime("key", {"output": "persisted"})
+        cache.close()
+
+        reopened = SQLiteCache(db_path=db_path)
+        assert reopened.get("key") == {"output": "persisted"}
+        reopened.close()
+
+    def test_hot_cache_invalidated_on_write(self, sqlite_cache):
+        """Test that re-priming or evicting a key is visible to later reads"""
+        sqlite_cache.prime("key", {"v": 1})
+        assert sqlite_cache.get("key") == {"v": 1}
+        sqlite_cache.prime("key", {"v": 2})
+        assert sqlite_cache.get("key") == {"v": 2}
+        sqlite_cache.evict("key")
+        assert sqlite_cache.get("key") is None
+
+    def test_prime_many(self, sqlite_cache):
+        """Test bulk priming in one transaction"""
+        sqlite_cache.prime_many([("a", {"v": 1}), ("b", {"v": 2})])
+        assert sqlite_cache.get("a") == {"v": 1}
+        assert sqlite_cache.get("b") == {"v": 2}
+        assert sqlite_cache.stats()["total_entries"] == 2
+
+    def test_evict_and_clear(self, sqlite_cache):
+        """Test removing entries"""
+        sqlite_cache.prime("a", {"v": 1})
+        sqlite_cache.prime("b", {"v": 2})
+        sqlite_cache.evict("a")
+        assert sqlite_cache.get("a") is None
+        assert sqlite_cache.get("b") == {"v": 2}
+        sqlite_cache.clear()
+        assert sqlite_cache.stats()["total_entries"] == 0
+
+    def test_expiration(self, tmp_path):
+        """Test that expired entries are not returned and can be cleaned up"""
+        cache = SQLiteCache(db_path=tmp_path / "cache.db", ttl_seconds=-1)
+        cache.prime("old", {"v": 1})
+        assert cache.stats()["expired_entries"] == 1
+        assert cache.cleanup_expired() == 1
+        assert cache.get("old") is None
+        cache.close()
+
+    def test_uses_wal_journal(self, sqlite_cache):
+        """Test that file-backed caches run in WAL mode"""
+        mode = sqlite_cache.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_incremental_auto_vacuum(self, sqlite_cache):
+        """Test that new databases are created with incremental auto-vacuum"""
+        assert sqlite_cache.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    def test_existing_database_converted_to_incremental_auto_vacuum(self, tmp_path):
+        """Test that a database created without auto-vacuum is converted on open"""
+        import sqlite3
+
+        conn = sqlite3.connect(str(tmp_path / "cache.db"))
+        conn.execute("CREATE TABLE cache (cache_key TEXT PRIMARY KEY, response BLOB NOT NULL, expires_at INTEGER)")
+        conn.close()
+
+        cache = SQLiteCache(db_path=tmp_path / "cache.db")
+        assert cache.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        cache.close()
+
+    def test_in_memory_database(self):
+        """Test that an in-memory cache works without WAL"""
+        cache = SQLiteCache(db_path=":memory:")
+        cache.prime("key", {"v": 1})
+        assert cache.get("key") == {"v": 1}
+        cache.close()
+
+    def test_expired_read_does_not_delete(self, tmp_path):
+        """Test that reading an expired entry leaves it for the batched sweep"""
+        cache = SQLiteCache(db_path=tmp_path / "cache.db", ttl_seconds=-1)
+        cache.prime("old", {"v": 1})
+        assert cache.get("old") is None
+        assert cache.stats()["total_entries"] == 1
+        cache.close()
+
+    def test_periodic_cleanup(self, tmp_path):
+        """Test that expired entries are swept after CLEANUP_INTERVAL writes"""
+        cache = SQLiteCache(db_path=tmp_path / "cache.db", ttl_seconds=-1)
+        cache.CLEANUP_INTERVAL = 3
+        cache.prime("a", {"v": 1})
+        cache.prime("b", {"v": 2})
+        assert cache.stats()["total_entries"] == 2
+        cache.prime("c", {"v": 3})
+        assert cache.stats()["total_entries"] == 0
+        cache.close()
+
+
+class TestMemoryCache:
+    """Test suite for MemoryCache"""
+
+    def test_prime_many(self):
+        """Test bulk priming"""
+        cache = MemoryCache()
+        cache.prime_many([("a", {"v": 1}), ("b", {"v": 2})])
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("b") == {"v": 2}
+
+    def test_eviction(self):
+        """Test that the least-hit entry is evicted when full"""
+        cache = MemoryCache(max_entries=2)
+        cache.prime("a", {"v": 1})
+        cache.prime("b", {"v": 2})
+        cache.get("a")
+        cache.prime("c", {"v": 3})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("c") == {"v": 3}
+
+    def test_eviction_keeps_newly_primed_entry(self):
+        """Test that a new entry isn't evicted for having no hits yet"""
+        cache = MemoryCache(max_entries=1)
+        cache.prime("a", {"v": 1})
+        cache.get("a")
+        cache.prime("b", {"v": 2})
+        assert cache.get("b") == {"v": 2}
+        assert cache.get("a") is None
+
+    def test_prime_many_larger_than_cache(self):
+        """Test that a batch larger than max_entries still leaves the cache full"""
+        cache = MemoryCache(max_entries=2)
+        cache.prime("a", {"v": 0})
+        cache.prime_many([("b", {"v": 1}), ("c", {"v": 2}), ("d", {"v": 3})])
+        assert len(cache.cache) == 2
+        assert cache.get("a") is None
@@ -0,0 +1,31 @@
+"""
+Tests for shared database engines
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from kurral.database.connection import DatabaseConnection
+
+
+class TestDatabaseConnection:
+    """Test suite for DatabaseConnection engine sharing"""
+
+    def test_engine_shared_per_pool_settings(self, tmp_path):
+        """Test that engines are reused only for the same URL and pool settings"""
+        url = f"sqlite:///{tmp_path / 'metadata.db'}"
+
+        default = DatabaseConnection(url)
+        assert DatabaseConnection(url).engine is default.engine
+
+        sized = DatabaseConnection(url, pool_size=20, max_overflow=0)
+        assert sized.engine is not default.engine
+        assert sized.engine.pool.size() == 20
+
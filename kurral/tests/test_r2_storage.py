@@ -0,0 +1,224 @@
+"""
+Tests for R2Storage against the in-memory S3 client
+"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from kurral.models.kurral import (
+    GraphVersion,
+    KurralArtifact,
+    LLMParameters,
+    ModelConfig,
+    ReplayLevel,
+    ResolvedPrompt,
+    TimeEnvironment,
+    TokenUsage,
+)
+from kurral.storage.r2_storage import R2Storage
+from kurral.storage.testing import NullS3Client
+
+
+@pytest.fixture
+def r2_storage():
+    """Create an R2Storage backed by NullS3Client (no boto3 needed)"""
+    return R2Storage(
+        account_id="account",
+        access_key_id="key",
+        secret_access_key="secret",
+        bucket_name="bucket",
+        tenant_id="test_tenant",
+        agent_name="test_agent",
+        client=NullS3Client(),
+    )
+
+
+@pytest.fixture
+def artifact():
+    """Create a minimal artifact to store"""
+    return KurralArtifact(
+        kurral_id=uuid4(),
+        run_id="test_run_123",
+        tenant_id="test_tenant",
+        semantic_buckets=["test"],
+        environment="test",
+        deterministic=True,
+        replay_level=ReplayLevel.A,
+        inputs={"query": "test query"},
+        outputs={"result": "test result"},
+        llm_config=ModelConfig(
+            model_name="gpt-4-0613",
+            provider="openai",
+            parameters=LLMParameters(temperature=0.0),
+        ),
+        resolved_prompt=ResolvedPrompt(template="Test prompt", final_text="Test prompt"),
+        graph_version=GraphVersion(graph_hash="test_graph_hash", tool_schemas_hash="test_tool_hash"),
+        tool_calls=[],
+        time_env=TimeEnvironment(timestamp=datetime.utcnow(), wall_clock_time="2024-01-01T00:00:00Z"),
+        duration_ms=100,
+        token_usage=TokenUsage(),
+    )
+
+
+class TestR2Storage:
+    """Test suite for R2Storage"""
+
+    def test_save_and_load(self, r2_storage, artifact):
+        """Test saving and loading an artifact"""
+        result = r2_storage.save(artifact)
+        assert result.success
+        assert result.storage_uri.startswith("r2://bucket/test_tenant/test_agent/artifacts/")
+
+        loaded = r2_storage.load(artifact.kurral_id)
+        assert loaded is not None
+        assert loaded.kurral_id == artifact.kurral_id
+        assert loaded.run_id == artifact.run_id
+
+    def test_load_by_uri(self, r2_storage, artifact):
+        """Test loading an artifact directly from its storage URI"""
+        result = r2_storage.save(artifact)
+        loaded = r2_storage.load_by_uri(result.storage_uri)
+        assert loaded.kurral_id == artifact.kurral_id
+
+    def test_exists_and_delete(self, r2_storage, artifact):
+        """Test existence checks before and after deletion"""
+        r2_storage.save(artifact)
+        assert r2_storage.exists(artifact.kurral_id)
+
+        assert r2_storage.delete(artifact.kurral_id)
+        assert not r2_storage.exists(artifact.kurral_id)
+        assert not r2_storage.delete(artifact.kurral_id)
+
+    def test_deleted_elsewhere_not_reported(self, r2_storage, artifact):
+        """Test that a cached key is rechecked after another instance deletes the object"""
+        other = R2Storage(
+            account_id="account",
+            access_key_id="key",
+            secret_access_key="secret",
+            bucket_name="bucket",
+            tenant_id="test_tenant",
+            agent_name="test_agent",
+            client=r2_storage.s3_client,
+        )
+        r2_storage.save(artifact)
+        assert r2_storage.exists(artifact.kurral_id)
+
+        assert other.delete(artifact.kurral_id)
+        assert not r2_storage.exists(artifact.kurral_id)
+
+        r2_storage.save(artifact)
+        other.delete(artifact.kurral_id)
+        assert not r2_storage.delete(artifact.kurral_id)
+
+    def test_large_artifact_compressed(self, r2_storage, artifact):
+        """Test that artifacts above the compression threshold round-trip gzipped"""
+        artifact.outputs = {"result": "x" * 20_000}
+        result = r2_storage.save(artifact)
+        assert result.size_bytes < 20_000
+
+        loaded = r2_storage.load(artifact.kurral_id)
+        assert loaded.outputs == {"result": "x" * 20_000}
+
+    def test_list_artifacts(self, r2_storage, artifact):
+        """Test listing artifacts, with and without a date range"""
+        other = artifact.model_copy(update={
+            "kurral_id": uuid4(),
+            "created_at": datetime(2020, 1, 15),
+        })
+        r2_storage.save(artifact)
+        r2_storage.save(other)
+
+        assert len(r2_storage.list_artifacts()) == 2
+
+        in_range = r2_storage.list_artifacts(
+            start_date=datetime(2020, 1, 1), end_date=datetime(2020, 1, 31)
+        )
+        assert [a.kurral_id for a in in_range] == [other.kurral_id]
+
+    def test_list_artifacts_open_ended_and_aware_dates(self, r2_storage, artifact):
+        """Test single date bounds and mixing timezone-aware with naive datetimes"""
+        other = artifact.model_copy(update={
+            "kurral_id": uuid4(),
+            "created_at": datetime(2020, 1, 15),
+        })
+        r2_storage.save(artifact)
+        r2_storage.save(other)
+
+        since = r2_storage.list_artifacts(start_date=datetime(2021, 1, 1, tzinfo=timezone.utc))
+        assert [a.kurral_id for a in since] == [artifact.kurral_id]
+
+        until = r2_storage.list_artifacts(end_date=datetime(2020, 1, 31, tzinfo=timezone.utc))
+        assert [a.kurral_id for a in until] == [other.kurral_id]
+
+        both = r2_storage.list_artifacts(
+            start_date=datetime(2020, 1, 1), end_date=datetime.now(timezone.utc)
+        )
+        assert len(both) == 2
+
+    def test_list_artifacts_filtered(self, r2_storage, artifact):
+        """Test filtering listed artifacts by replay level and determinism"""
+        level_b = artifact.model_copy(update={
+            "kurral_id": uuid4(),
+            "replay_level": ReplayLevel.B,
+            "deterministic": False,
+        })
+        r2_storage.save(artifact)
+        r2_storage.save(level_b)
+
+        artifacts = r2_storage.list_artifacts(replay_level=ReplayLevel.B)
+        assert [a.kurral_id for a in artifacts] == [level_b.kurral_id]
+
+        assert [a.kurral_id for a in r2_storage.list_artifacts(deterministic=True)] == [artifact.kurral_id]
+
+    def test_list_artifacts_filtered_with_limit(self, r2_storage, artifact):
+        """Test that a filtered, limited listing looks past the newest month"""
+        older = artifact.model_copy(update={
+            "kurral_id": uuid4(),
+            "replay_level": ReplayLevel.B,
+            "created_at": datetime(2020, 1, 15),
+        })
+        r2_storage.save(artifact)
+        r2_storage.save(older)
+
+        artifacts = r2_storage.list_artifacts(limit=1, replay_level=ReplayLevel.B)
+        assert [a.kurral_id for a in artifacts] == [older.kurral_id]
+
+    def test_multipart_upload(self, artifact):
+        """Test that artifacts above MULTIPART_THRESHOLD upload through boto3's transfer manager"""
+        boto3 = pytest.importorskip("boto3")
+        from botocore.stub import Stubber
+
+        client = boto3.session.Session().client(
+            "s3",
+            endpoint_url="https://account.r2.cloudflarestorage.com",
+            aws_access_key_id="key",
+            aws_secret_access_key="secret",
+            region_name="auto",
+        )
+        storage = R2Storage(
+            account_id="account",
+            access_key_id="key",
+            secret_access_key="secret",
+            bucket_name="bucket",
+            tenant_id="test_tenant",
+            agent_name="test_agent",
+            compress=False,
+            client=client,
+        )
+        artifact.outputs = {"result": "x" * R2Storage.MULTIPART_THRESHOLD}
+
+        with Stubber(client) as stubber:
+            stubber.add_response("create_multipart_upload", {"UploadId": "upload"})
+            stubber.add_response("upload_part", {"ETag": '"part-1"'})
+            stubber.add_response("complete_multipart_upload", {})
+            result = storage.save(artifact)
+            stubber.assert_no_pending_responses()
+
+        assert result.success, result.error
+        assert result.size_bytes >= R2Storage.MULTIPART_THRESHOLD
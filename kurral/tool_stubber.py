@@ -6,6 +6,7 @@ Intercepts tool calls and returns cached responses from artifact
 from typing import Any, Dict, Optional, Callable, Tuple
 from datetime import datetime
 from kurral.models.kurral import ToolCall, ToolCallStatus
+from kurral.side_effect_config import SideEffectConfig
 
 
 def _calculate_semantic_similarity(text1: str, text2: str) -> float:
@@ -124,6 +125,12 @@ class ToolStubber:
         for tc in artifact_tool_calls:
             if tc.cache_key:
                 self.cache[tc.cache_key] = tc
+        
+        # Bucket cache keys by tool name in one pass so semantic matching only
+        # scans calls to the same tool instead of filtering the whole cache
+        self._keys_by_tool: Dict[str, list[str]] = {}
+        for cache_key, tc in self.cache.items():
+            self._keys_by_tool.setdefault(tc.tool_name, []).append(cache_key)
     
     def stub_tool_call(self, tool_name: str, tool_input: Dict[str, Any], similarity_threshold: float = 0.85) -> Optional[Tuple[Dict[str, Any], str, float]]:
         """
@@ -143,7 +150,6 @@ class ToolStubber:
             For side effect tools, always returns a result (cached or safe default)
         """
         # Check if this is a side effect tool
-        from kurral.side_effect_config import SideEffectConfig
         is_side_effect = SideEffectConfig.is_side_effect(self.side_effect_config, tool_name)
         
         # First, try exact match
@@ -160,14 +166,12 @@ class ToolStubber:
         best_match: Optional[Tuple[ToolCall, float, str]] = None
         best_similarity = 0.0
         
-        for cached_key, cached_tc in self.cache.items():
+        for cached_key in self._keys_by_tool.get(tool_name, ()):
             # Skip if already used (each tool call should only be matched once)
             if cached_key in self.used_keys:
                 continue
             
-            # Only compare if tool names match
-            if cached_tc.tool_name != tool_name:
-                continue
+            cached_tc = self.cache[cached_key]
             
             # Compare inputs using semantic similarity
             similarity = _compare_tool_inputs(tool_input, cached_tc.input)
@@ -197,11 +201,15 @@ class ToolStubber:
     
     def get_unused_tool_calls(self) -> list[ToolCall]:
         """Get tool calls from artifact that weren't used during replay"""
-        unused = []
-        for cache_key, tc in self.cache.items():
-            if cache_key not in self.used_keys:
-                unused.append(tc)
-        return unused
+        used_keys = self.used_keys
+        return [tc for cache_key, tc in self.cache.items() if cache_key not in used_keys]
+    
+    def get_used_tool_calls(self) -> list[ToolCall]:
+        """Get cached tool calls that were served during replay, marked as stubbed"""
+        used = [self.cache[cache_key] for cache_key in self.used_keys if cache_key in self.cache]
+        for tc in used:
+            tc.stubbed_in_replay = True
+        return used
     
     def record_new_tool_call(
         self, 
@@ -223,13 +231,14 @@ class ToolStubber:
             ToolCall object
         """
         cache_key = ToolCall.generate_cache_key(tool_name, tool_input)
+        now = datetime.utcnow()
         
         tool_call = ToolCall(
             tool_name=tool_name,
             input=tool_input,
             output=tool_output,
-            start_time=datetime.utcnow(),
-            end_time=datetime.utcnow(),
+            start_time=now,
+            end_time=now,
             latency_ms=0,
             status=ToolCallStatus.OK,
             cache_key=cache_key,
@@ -295,7 +304,6 @@ def create_stubbed_tool(original_func: Callable, stubber: ToolStubber, tool_name
         else:
             # CACHE MISS: Similarity < 85% or no cached match found
             # Check if this is a side effect tool
-            from kurral.side_effect_config import SideEffectConfig
             is_side_effect = SideEffectConfig.is_side_effect(side_effect_config or {}, tool_name)
             
             if is_side_effect: